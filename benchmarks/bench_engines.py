@@ -0,0 +1,136 @@
+"""Table engine benchmark: pdfplumber's table finder vs. the positional engine.
+
+Times PDFParser.extract_tables_by_page() + parse_table_rows() per engine, and
+PrayerTimesExtractor end to end with the 'plumber' and 'auto' settings, on
+generated PDFs (or the given ones). Every result is checked against the rows
+the table finder produces:
+
+    python -m benchmarks.bench_engines
+    python -m benchmarks.bench_engines --zones 13 --months 01 02 --pages 2
+    python -m benchmarks.bench_engines --pdf data/prayer_times/*.pdf
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.fake_acju import build_pdf, check_rows, prayer_rows
+from config.settings import FILENAME_TO_CITY, MONTH_NAMES
+from src.extractor.engines import ENGINES
+from src.extractor.pdf_parser import PDFParser
+from src.extractor.time_extractor import PrayerTimesExtractor
+from src.utils.text_utils import extract_month_from_text
+
+
+def generate_pdfs(directory: str, zones: int, months: List[str], pages: int) -> List[Tuple[str, str]]:
+    """
+    Write fake ACJU PDFs.
+    
+    Returns:
+        List of (path, month) tuples
+    """
+    check_rows(zones, months)
+    pdfs = []
+    for zone_index, patterns in enumerate(list(FILENAME_TO_CITY.values())[:zones], start=1):
+        for month in months:
+            month_name = MONTH_NAMES[month]
+            path = os.path.join(directory, f"Prayer-Times-{month_name}-{patterns[0]}.pdf")
+            title = f"Prayer Times {month_name} 2025 Zone: {zone_index:02d}"
+            with open(path, 'wb') as f:
+                f.write(build_pdf(title, prayer_rows(zone_index, month), pages))
+            pdfs.append((path, month))
+    return pdfs
+
+
+def parse_pdf(parser: PDFParser, path: str, month: str, engine: str) -> List[Dict]:
+    """Rows of one PDF as parse_table_rows() returns them."""
+    rows = []
+    for _, table in parser.extract_tables_by_page(path, engine=engine):
+        rows.extend(parser.parse_table_rows(table, month))
+    return rows
+
+
+def _time_extractor(pdfs: List[Tuple[str, str]], engine: str, repeat: int) -> Dict:
+    """Best end-to-end PrayerTimesExtractor time with one engine setting."""
+    best = None
+    for _ in range(repeat):
+        extractor = PrayerTimesExtractor(engine=engine)
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for path, _ in pdfs:
+                extractor.extract_from_pdf(path, os.path.basename(path))
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    records = sum(len(times) for times in extractor.get_prayer_times().values())
+    return {'seconds': best, 'rows': records, 'times': extractor.get_prayer_times()}
+
+
+def run(pdfs: List[Tuple[str, str]], repeat: int = 3) -> Dict[str, Dict]:
+    """
+    Time every table engine alone and the extractor end to end.
+    
+    Returns:
+        Dictionary with 'engines' and 'extractor' results: timing, row
+        count and whether the rows match the table finder's
+    """
+    parser = PDFParser()
+    engines = {}
+    for engine in ENGINES:
+        best, rows = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = [parse_pdf(parser, path, month, engine) for path, month in pdfs]
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        engines[engine] = {'seconds': best, 'rows': sum(len(r) for r in rows), 'parsed': rows}
+    reference = engines['plumber']['parsed']
+    for result in engines.values():
+        result['matches'] = result.pop('parsed') == reference
+    
+    extractor = {engine: _time_extractor(pdfs, engine, repeat) for engine in ("plumber", "auto")}
+    reference = extractor['plumber']['times']
+    for result in extractor.values():
+        result['matches'] = result.pop('times') == reference
+    
+    return {'engines': engines, 'extractor': extractor}
+
+
+def _print_results(title: str, results: Dict[str, Dict]):
+    baseline = results['plumber']['seconds']
+    print(title)
+    for name, result in results.items():
+        agreement = "same rows as plumber" if result['matches'] else "⚠ rows differ from plumber"
+        print(f"  • {name:<11} {result['seconds']:.3f}s  {baseline / result['seconds']:.1f}x  "
+              f"{result['rows']} rows, {agreement}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the PDF table engines")
+    parser.add_argument("--zones", type=int, default=4)
+    parser.add_argument("--months", nargs="*", default=["01", "02", "03"])
+    parser.add_argument("--pages", type=int, default=1, help="Pages per generated PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine (the best is reported)")
+    parser.add_argument("--pdf", nargs="*", help="Benchmark these PDFs instead of generated ones")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        if args.pdf:
+            pdfs = []
+            for path in args.pdf:
+                text, _, _ = PDFParser().extract_text_and_metadata(path)
+                pdfs.append((path, extract_month_from_text(text) or extract_month_from_text(path)))
+        else:
+            pdfs = generate_pdfs(directory, args.zones, args.months, args.pages)
+        results = run(pdfs, args.repeat)
+    
+    print(f"📈 Engine benchmark ({len(pdfs)} PDFs, best of {args.repeat})")
+    _print_results("Table engines (extract_tables_by_page + parse_table_rows):", results['engines'])
+    _print_results("PrayerTimesExtractor end to end (engine setting):", results['extractor'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""End-to-end scraping benchmark against the local fake ACJU site.
+
+Runs ACJUWebScraper.get_districts() and PDFDownloader.download_pdfs() against
+FakeACJUServer and reports wall time, request counts and retries:
+
+    python -m benchmarks.bench_scrape
+    python -m benchmarks.bench_scrape --latency 0.05 0.2 --error-rate 0.1
+    python -m benchmarks.bench_scrape --throttle 5 --months 01 02
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from benchmarks.fake_acju import FakeACJUServer
+from src.scraper.web_scraper import ACJUWebScraper
+from src.scraper.pdf_downloader import PDFDownloader
+
+
+def run(zones: int, months, pages: int, latency, error_rate: float, throttle, retries: int,
+        backoff: float, quiet: bool = True) -> dict:
+    """
+    Run one scrape + download pass and collect its numbers.
+    
+    Returns:
+        Dictionary of timings, request counts and outcomes
+    """
+    server = FakeACJUServer(zones=zones, months=months, pages=pages, latency=tuple(latency),
+                            error_rate=error_rate, throttle=throttle).start()
+    try:
+        with tempfile.TemporaryDirectory() as download_dir:
+            scraper = ACJUWebScraper(base_url=server.base_url, request_delay=None)
+            downloader = PDFDownloader(download_dir, max_retries=retries, backoff_factor=backoff,
+                                       request_delay=None)
+            
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+                started = time.perf_counter()
+                scraped = scraper.get_districts()
+                scraped_at = time.perf_counter()
+                files = downloader.download_pdfs(scraped)
+                finished = time.perf_counter()
+    finally:
+        server.stop()
+    
+    stats = server.stats()
+    expected = zones * len(server.months)
+    faults = sum(count for key, count in stats.items() if key.endswith(('_429', '_500', '_502', '_503')))
+    return {
+        'scrape_seconds': scraped_at - started,
+        'download_seconds': finished - scraped_at,
+        'total_seconds': finished - started,
+        'sections': len(scraped),
+        'expected_pdfs': expected,
+        'downloaded_pdfs': len(files),
+        'requests': stats.get('total', 0),
+        'retries': faults,
+        'counts': stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraping against a local fake ACJU site")
+    parser.add_argument("--zones", type=int, default=13)
+    parser.add_argument("--months", nargs="*", default=["01", "02", "03"])
+    parser.add_argument("--pages", type=int, default=1, help="Pages per generated PDF")
+    parser.add_argument("--latency", nargs=2, type=float, default=[0.0, 0.0], metavar=("MIN", "MAX"))
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle", type=float, default=None, help="Requests per second before 429s")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=1.0, help="PDFDownloader backoff_factor")
+    parser.add_argument("--verbose", action="store_true", help="Show scraper/downloader output")
+    args = parser.parse_args()
+    
+    result = run(args.zones, args.months, args.pages, args.latency, args.error_rate,
+                 args.throttle, args.retries, args.backoff, quiet=not args.verbose)
+    
+    print("📈 Scrape benchmark")
+    print(f"  • get_districts:  {result['scrape_seconds']:.2f}s ({result['sections']} sections)")
+    print(f"  • download_pdfs:  {result['download_seconds']:.2f}s "
+          f"({result['downloaded_pdfs']}/{result['expected_pdfs']} PDFs)")
+    print(f"  • total:          {result['total_seconds']:.2f}s")
+    print(f"  • requests:       {result['requests']} ({result['retries']} answered with 429/5xx)")
+    for key in sorted(result['counts']):
+        if key != 'total':
+            print(f"      {key}: {result['counts'][key]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Local stand-in for the ACJU prayer times site.
+
+Serves the accordion markup parsed by ACJUWebScraper, generated prayer time
+PDFs and robots.txt, with optional latency, 5xx and throttling injection:
+
+    server = FakeACJUServer(latency=(0.01, 0.05), error_rate=0.1).start()
+    scraper = ACJUWebScraper(base_url=server.base_url, request_delay=None)
+    ...
+    server.stop()
+    print(server.stats())
+"""
+
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import FILENAME_TO_CITY, MONTH_NAMES, PRAYER_FIELDS
+from src.extractor.validator import BlockValidator
+from src.utils.date_utils import days_in_month
+
+COLUMNS = ['Date', 'Fajr', 'Sunrise', 'Luhar', 'Asr', 'Maghrib', 'Isha']
+# Base times (minutes since midnight) and column x positions for the tables
+BASE_MINUTES = [290, 370, 735, 930, 1085, 1160]
+COLUMN_X = [40, 110, 180, 250, 320, 390, 460, 530]
+
+
+def _format_time(minutes: int) -> str:
+    hour, minute = divmod(minutes, 60)
+    suffix = 'AM' if hour < 12 else 'PM'
+    return f"{(hour - 1) % 12 + 1}:{minute:02d} {suffix}"
+
+
+def prayer_rows(zone_index: int, month: str) -> List[List[str]]:
+    """Plausible, slowly drifting prayer times for one zone and month."""
+    abbreviation = MONTH_NAMES[month][:3]
+    rows = []
+    for day in range(1, days_in_month(month) + 1):
+        # One minute every ten days: monotonic within the month and well
+        # under MAX_DAILY_DELTA_MINUTES, so every block validates
+        drift = int(month) % 4 + day // 10 + zone_index
+        rows.append([f"{day}-{abbreviation}"] + [_format_time(m + drift) for m in BASE_MINUTES])
+    return rows
+
+
+def check_rows(zones: int = len(FILENAME_TO_CITY), months: Optional[List[str]] = None):
+    """
+    Check that every generated (zone, month) block passes BlockValidator.
+    
+    Raises:
+        ValueError: Listing the blocks that fail
+    """
+    validator = BlockValidator()
+    failures = []
+    for zone_index in range(1, zones + 1):
+        for month in months or sorted(MONTH_NAMES):
+            block = {
+                f"{month}-{int(row[0].split('-')[0]):02d}": dict(zip(PRAYER_FIELDS, row[1:]))
+                for row in prayer_rows(zone_index, month)
+            }
+            report = validator.validate(block, month)
+            if not report['valid']:
+                failures.append(f"zone {zone_index} month {month}: {', '.join(report['issues'])}")
+    if failures:
+        raise ValueError("Generated prayer times fail validation: " + "; ".join(failures))
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _page_stream(title: str, rows: List[List[str]]) -> bytes:
+    """Content stream with a title and a ruled 7-column table."""
+    ops = ["BT /F1 14 Tf 40 800 Td (" + _escape(title) + ") Tj ET"]
+    table = [COLUMNS] + rows
+    top, row_height = 770, 20
+    bottom = top - row_height * len(table)
+    
+    # Grid lines so pdfplumber's table finder sees the cells
+    for i in range(len(table) + 1):
+        y = top - i * row_height
+        ops.append(f"{COLUMN_X[0]} {y} m {COLUMN_X[-1]} {y} l S")
+    for x in COLUMN_X:
+        ops.append(f"{x} {top} m {x} {bottom} l S")
+    
+    for i, row in enumerate(table):
+        y = top - (i + 1) * row_height + 6
+        for x, cell in zip(COLUMN_X, row):
+            ops.append(f"BT /F1 9 Tf {x + 4} {y} Td ({_escape(cell)}) Tj ET")
+    return "\n".join(ops).encode('latin-1')
+
+
+def build_pdf(title: str, rows: List[List[str]], pages: int = 1) -> bytes:
+    """
+    Build a minimal PDF holding the rows as a ruled table.
+    
+    Args:
+        title: Title line (should contain the zone and month)
+        rows: Table rows without the header
+        pages: Number of pages to split the rows across
+        
+    Returns:
+        PDF file bytes
+    """
+    per_page = -(-len(rows) // pages)
+    chunks = [rows[i:i + per_page] for i in range(0, len(rows), per_page)]
+    page_count = len(chunks)
+    
+    # Object numbers: 1 catalog, 2 pages, 3 font, then (page, content) pairs
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for index, chunk in enumerate(chunks):
+        page_obj, content_obj = 4 + index * 2, 5 + index * 2
+        kids.append(f"{page_obj} 0 R")
+        stream = _page_stream(title, chunk)
+        objects[page_obj] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj} 0 R >>"
+        ).encode('latin-1')
+        objects[content_obj] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {page_count} >>".encode('latin-1')
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for number in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[number]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class FakeACJUServer:
+    """
+    Threaded HTTP server mimicking acju.lk for scraping benchmarks.
+    
+    Args:
+        zones: Number of zones (sections) to publish, up to 13
+        months: Month numbers to publish for every zone
+        pages: Pages per generated PDF
+        latency: (min, max) seconds added to every response
+        error_rate: Fraction of requests answered with a random 5xx
+        throttle: Maximum requests per second before answering 429
+        seed: Random seed for reproducible fault injection
+    """
+    
+    def __init__(self, zones: int = 13, months: Optional[List[str]] = None, pages: int = 1,
+                 latency: Tuple[float, float] = (0.0, 0.0), error_rate: float = 0.0,
+                 throttle: Optional[float] = None, seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.months = months or sorted(MONTH_NAMES)
+        check_rows(min(zones, len(FILENAME_TO_CITY)), self.months)
+        self.pages = pages
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle = throttle
+        self.random = random.Random(seed)
+        self.counts = Counter()
+        self._lock = threading.Lock()
+        self._recent = []
+        self._pdfs = {}
+        self._sections = self._build_sections(list(FILENAME_TO_CITY.items())[:zones])
+        self._page = self._build_page()
+        self._etag = '"' + hashlib.sha256(self._page).hexdigest()[:16] + '"'
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+    
+    def start(self) -> "FakeACJUServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def stats(self) -> Dict[str, int]:
+        """Request counts by kind ('page', 'pdf', 'robots') and status."""
+        with self._lock:
+            return dict(self.counts)
+    
+    def _build_sections(self, zones) -> List[dict]:
+        sections = []
+        for zone_index, (city_id, patterns) in enumerate(zones, start=1):
+            items = []
+            for month in self.months:
+                month_name = MONTH_NAMES[month]
+                filename = f"Prayer-Times-{month_name}-{patterns[0]}.pdf"
+                title = f"Prayer Times {month_name} 2025 Zone: {zone_index:02d}"
+                self._pdfs[filename] = build_pdf(title, prayer_rows(zone_index, month), self.pages)
+                items.append({'month': month_name, 'path': f"/wp-content/uploads/{filename}"})
+            sections.append({'section': patterns[0].replace('-', ' ').title(), 'items': items})
+        return sections
+    
+    def _build_page(self) -> bytes:
+        details = []
+        for section in self._sections:
+            rows = "".join(
+                f'<div><div><p><span>{item["month"]}</span></p></div>'
+                f'<div><a href="{item["path"]}">Download</a></div></div>'
+                for item in section['items']
+            )
+            details.append(
+                f'<details><summary><span>{section["section"]}</span><span>+</span></summary>'
+                f'<div role="region">{rows}</div></details>'
+            )
+        html = f'<html><body><div class="e-n-accordion">{"".join(details)}</div></body></html>'
+        return html.encode('utf-8')
+    
+    def _inject(self) -> Optional[int]:
+        """Sleep for the configured latency and pick a fault status, if any."""
+        low, high = self.latency
+        if high > 0:
+            time.sleep(self.random.uniform(low, high))
+        
+        with self._lock:
+            if self.throttle:
+                now = time.monotonic()
+                self._recent = [t for t in self._recent if now - t < 1.0]
+                if len(self._recent) >= self.throttle:
+                    return 429
+                self._recent.append(now)
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.random.choice([500, 502, 503])
+        return None
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/robots.txt':
+                    kind, body, content_type = 'robots', b"User-agent: *\nAllow: /\n", 'text/plain'
+                elif path.rstrip('/') == '/prayer-times':
+                    kind, body, content_type = 'page', server._page, 'text/html; charset=utf-8'
+                elif path.startswith('/wp-content/uploads/') and path.rsplit('/', 1)[-1] in server._pdfs:
+                    kind, body, content_type = 'pdf', server._pdfs[path.rsplit('/', 1)[-1]], 'application/pdf'
+                else:
+                    return self._respond('other', 404)
+                
+                fault = server._inject() if kind != 'robots' else None
+                if fault:
+                    headers = {'Retry-After': '1'} if fault == 429 else {}
+                    return self._respond(kind, fault, headers=headers)
+                if kind == 'page' and self.headers.get('If-None-Match') == server._etag:
+                    return self._respond(kind, 304, headers={'ETag': server._etag})
+                headers = {'ETag': server._etag} if kind == 'page' else {}
+                self._respond(kind, 200, body, content_type, headers)
+            
+            def _respond(self, kind, status, body=b"", content_type='text/plain', headers=None):
+                with server._lock:
+                    server.counts[f"{kind}_{status}"] += 1
+                    server.counts['total'] += 1
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
@@ -6,9 +6,27 @@ BASE_URL = "https://www.acju.lk/"
 # Directories
 DOWNLOAD_DIR = "data/prayer_times"
 OUTPUT_DIR = "output"
+PATCH_DIR = "output/patches"
+EXPORT_DIR = "output/exports"
 
 # File names
 OUTPUT_FILENAME = "prayer_times_sri_lanka_full.json"
+COMPACT_FILENAME = "prayer_times_sri_lanka_compact.json"
+ARCHIVE_FILENAME = "prayer_times_archive.json"
+SQLITE_FILENAME = "prayer_times_sri_lanka.db"
+JOURNAL_FILENAME = ".run_journal.jsonl"
+DAEMON_STATE_FILENAME = ".daemon_state.json"
+MANIFEST_FILENAME = ".link_manifest.json"
+
+# Number of dataset versions (and patches) kept in the patch chain
+PATCH_HISTORY = 100
+
+# Precompressed siblings written next to the JSON output ('gz', 'zst')
+PRECOMPRESS_FORMATS = ["gz"]
+
+# Refresh daemon schedule
+DAEMON_INTERVAL = 6 * 3600  # seconds between refresh cycles
+DAEMON_JITTER = 15 * 60  # random +/- seconds added to each interval
 
 # Data structure
 VERSION = "1.0"
@@ -33,6 +51,23 @@ FILENAME_TO_CITY = {
     'jaffna': ['JAFFNA-DISTRICT-NALLUR']
 }
 
+# Mapping: zone city to every district sharing its time table
+ZONE_DISTRICTS = {
+    'colombo': ['Colombo', 'Gampaha', 'Kalutara'],
+    'hambantota': ['Hambantota'],
+    'ratnapura': ['Ratnapura', 'Kegalle'],
+    'galle': ['Galle', 'Matara'],
+    'badulla': ['Badulla', 'Monaragala'],
+    'trincomalee': ['Trincomalee'],
+    'batticaloa': ['Batticaloa', 'Ampara'],
+    'kandy': ['Kandy', 'Matale', 'Nuwara Eliya'],
+    'kurunegala': ['Kurunegala'],
+    'anuradhapura': ['Anuradhapura', 'Polonnaruwa'],
+    'mannar': ['Mannar', 'Puttalam'],
+    'vavuniya': ['Mullaitivu', 'Kilinochchi', 'Vavuniya'],
+    'jaffna': ['Jaffna', 'Nallur']
+}
+
 # Month patterns for extraction
 MONTH_PATTERNS = {
     r'\bjanuary\b': '01', r'\bjan\b': '01',
@@ -62,5 +97,23 @@ HIJRI_MONTHS = [
     "Ramadan", "Shawwal", "Dhu al-Qadah", "Dhu al-Hijjah"
 ]
 
+# Prayer columns in table order
+PRAYER_FIELDS = ["fajr", "sunrise", "luhar", "asr", "maghrib", "isha"]
+
+# Validation settings
+MAX_DAILY_DELTA_MINUTES = 5  # largest plausible day-to-day shift of a prayer time
+
 # Request settings
-REQUEST_TIMEOUT = 20  # seconds
\ No newline at end of file
+REQUEST_TIMEOUT = 20  # seconds
+ROBOTS_TTL = 24 * 3600  # seconds between robots.txt re-reads
+MANIFEST_TTL = 6 * 3600  # seconds before the link manifest is revalidated against the site
+
+# Memory settings
+MEMORY_LIMIT_MB = None  # RSS ceiling in MB (process plus page workers) before new work is held back (None = no ceiling)
+
+# Extraction engine settings
+PDF_ENGINE = "auto"  # 'plumber', 'positional', or 'auto' to try engines until a block validates
+AUTO_ENGINE_ORDER = ["positional", "plumber"]  # fastest first
+
+# Parallelism settings
+PAGE_WORKERS = 1  # worker processes for the pages of one PDF (1 = extract pages in-process)
\ No newline at end of file
@@ -4,12 +4,25 @@ import os
 import json
 import argparse
 
-from config.settings import DOWNLOAD_DIR, OUTPUT_DIR, OUTPUT_FILENAME
+from config.settings import (
+    DOWNLOAD_DIR, OUTPUT_DIR, OUTPUT_FILENAME, COMPACT_FILENAME, EXPORT_DIR, ARCHIVE_FILENAME, SQLITE_FILENAME, JOURNAL_FILENAME, MANIFEST_FILENAME, PATCH_DIR, PATCH_HISTORY,
+    PRECOMPRESS_FORMATS, DAEMON_INTERVAL, DAEMON_JITTER, MEMORY_LIMIT_MB, PAGE_WORKERS, PDF_ENGINE
+)
 from src.scraper.web_scraper import ACJUWebScraper
 from src.scraper.pdf_downloader import PDFDownloader
 from src.extractor.time_extractor import PrayerTimesExtractor
-from src.utils.file_utils import generate_output_json, save_json, cleanup_directory
+from src.storage.archive import ArchiveStore
+from src.storage.patches import PatchChain
+from src.storage.journal import RunJournal
+from src.storage.sqlite_store import SQLiteStore
+from src.storage.manifest import LinkManifest
+from src.service.daemon import RefreshDaemon
+from src.exporter.formats import export_all
+from src.exporter.zone_delta import encode_dataset
+from src.utils.file_utils import generate_output_json, save_json, load_json, cleanup_directory
 from src.utils.date_utils import natural_sort_key
+from src.utils.memory_utils import MemoryGovernor, MemoryReport
+from src.utils.json_index import save_index
 from src.utils.text_utils import normalize_month
 
 
@@ -29,15 +42,111 @@ def main():
     parser = argparse.ArgumentParser(description="ACJU Prayer Times Downloader & Extractor")
     parser.add_argument(
         "--mode",
-        choices=["prayer", "calendar"],
+        choices=["prayer", "calendar", "daemon"],
         default="prayer",
-        help="Select mode: 'prayer' to download & extract prayer times, or 'calendar' to scrape today's calendar info."
+        help="Select mode: 'prayer' to download & extract prayer times, 'calendar' to scrape today's calendar info, "
+             "or 'daemon' to keep refreshing the prayer times whenever the ACJU links change."
     )
     parser.add_argument(
         "--month",
         nargs="*",
         help="Month(s) to download (e.g., 'jan', 'feb', 'march'). Leave empty for all months.",
     )
+    parser.add_argument(
+        "--cities",
+        choices=["zones", "districts"],
+        default="zones",
+        help="List one city per prayer zone, or every district with a reference to its zone's time table.",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Also merge the extracted times into the multi-year archive.",
+    )
+    parser.add_argument(
+        "--compress",
+        nargs="*",
+        choices=["gz", "zst"],
+        default=PRECOMPRESS_FORMATS,
+        help="Precompressed copies to write next to the JSON output ('zst' needs the zstandard package).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its journal instead of starting over.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DAEMON_INTERVAL,
+        help="Daemon mode: seconds between refresh cycles (a random jitter is added).",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=DAEMON_JITTER,
+        help="Daemon mode: maximum random +/- seconds added to each interval.",
+    )
+    parser.add_argument(
+        "--notify-file",
+        help="Daemon mode: file rewritten with a JSON event after every rebuild.",
+    )
+    parser.add_argument(
+        "--notify-socket",
+        help="Daemon mode: Unix socket that receives a JSON event line after every rebuild.",
+    )
+    parser.add_argument(
+        "--export",
+        nargs="+",
+        choices=["ndjson", "csv", "ics"],
+        help="Also export the extracted times as NDJSON/CSV rows and per-city iCalendar feeds (single pass).",
+    )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="Also write an indexed SQLite database, rewriting only changed (zone, month) partitions.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Also write a compact copy storing every zone as per-prayer minute offsets from a reference zone.",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Release each PDF page as soon as it is parsed and only re-read pages that need the text fallback.",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=float,
+        default=MEMORY_LIMIT_MB,
+        metavar="MB",
+        help="Hold back new PDFs and page ranges while the RSS of the process and its page workers is above this many MB.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace Python allocations and print the peak memory of every PDF.",
+    )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=PAGE_WORKERS,
+        metavar="N",
+        help="Extract the tables of multi-page PDFs with N worker processes, merged in page order.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "positional", "plumber"],
+        default=PDF_ENGINE,
+        help="Table extraction engine; 'auto' tries the fast positional engine and falls back to pdfplumber's "
+             "table finder when its month block does not validate.",
+    )
+    parser.add_argument(
+        "--refresh-links",
+        action="store_true",
+        help="Revalidate the cached PDF link manifest against the website even if it is still fresh.",
+    )
     args = parser.parse_args()
     scraper = ACJUWebScraper()
 
@@ -47,6 +156,19 @@ def main():
         calendar_data = scraper.get_acju_calendar()
         print(json.dumps(calendar_data))
         return
+    
+    if args.mode == "daemon":
+        # --- Run change-driven refresh daemon ---
+        daemon = RefreshDaemon(
+            scraper,
+            interval=args.interval,
+            jitter=args.jitter,
+            notify_file=args.notify_file,
+            notify_socket=args.notify_socket,
+            compress=args.compress
+        )
+        daemon.run_forever()
+        return
 
     # --- Run prayer times extraction mode ---
     # Normalize all month inputs
@@ -61,19 +183,34 @@ def main():
     # Ensure output directory exists
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # Step 1: Scrape website for PDF links
-    print("🌐 Fetching district PDF links from ACJU website...")
-    scraped_data = scraper.get_districts()
+    # Journal every finished step so an interrupted run can be resumed
+    journal = RunJournal(os.path.join(OUTPUT_DIR, JOURNAL_FILENAME))
+    if args.resume:
+        journal.load()
+    else:
+        journal.reset()
+    
+    # Step 1: Scrape website for PDF links (or reuse the cached manifest)
+    manifest = LinkManifest(os.path.join(OUTPUT_DIR, MANIFEST_FILENAME))
+    if journal.scraped:
+        print("📒 Reusing district PDF links from the journal")
+        manifest.set_sections(journal.scraped)
+        has_links = bool(manifest.items)
+    else:
+        print("🌐 Fetching district PDF links from ACJU website...")
+        has_links = manifest.load().refresh(scraper, force=args.refresh_links)
+        if has_links:
+            journal.record_scraped(manifest.sections())
     
-    if not scraped_data:
+    if not has_links:
         print("❌ No data scraped!")
         return
     
-    print(f"✅ Found {len(scraped_data)} districts")
+    print(f"✅ Found {len(manifest.sections())} districts")
     
     # Step 2: Download PDFs
     downloader = PDFDownloader(DOWNLOAD_DIR)
-    downloaded_files = downloader.download_pdfs(scraped_data, months=months)
+    downloaded_files = downloader.download_items(manifest.select(months=months), journal=journal)
     
     if not downloaded_files:
         print("❌ No PDFs downloaded!")
@@ -82,18 +219,47 @@ def main():
     print(f"✅ Downloaded {len(downloaded_files)} PDF files\n")
     
     # Step 3: Extract prayer times from PDFs
-    extractor = PrayerTimesExtractor()
+    governor = MemoryGovernor(args.memory_limit)
+    extractor = PrayerTimesExtractor(
+        low_memory=args.low_memory,
+        page_workers=args.page_workers,
+        governor=governor,
+        engine=args.engine
+    )
+    memory_report = MemoryReport()
+    if args.memory_report:
+        memory_report.start()
     
     for idx, filepath in enumerate(sorted(downloaded_files, key=natural_sort_key)):
         filename = os.path.basename(filepath)
+        
+        entry = journal.get_parse(filepath)
+        if entry:
+            if entry['zone']:
+                extractor.restore_block(filename, entry['zone'], entry['month'], entry['year'], entry['times'])
+            print(f"📒 [{idx + 1}/{len(downloaded_files)}] Restored {filename} from journal ({entry['records']} records)\n")
+            continue
+        
         print(f"📄 [{idx + 1}/{len(downloaded_files)}] Processing {filename}...")
         
-        zone, month, records = extractor.extract_from_pdf(filepath, filename)
+        governor.wait_for_headroom()
+        with memory_report.track(filename):
+            zone, month, records = extractor.extract_from_pdf(filepath, filename)
         
         if zone and month:
             print(f"  → Zone: {zone}, Month: {month}, Records: {records}\n")
+            city_id = extractor.zone_mapper.get_city_info(zone)['id']
+            journal.record_parse(filepath, zone, month, extractor.get_block_years().get((city_id, month)),
+                                 extractor.get_month_block(zone, month))
         else:
             print(f"  → Skipped: {filename}\n")
+            journal.record_parse(filepath, None, None, None, {})
+    
+    extractor.close()
+    memory_report.stop()
+    memory_report.print_summary()
+    if governor.throttled:
+        print(f"🧠 Memory was above the {args.memory_limit:.0f} MB limit {governor.throttled} time(s)")
     
     # Step 4: Enhance ASR times
     extractor.enhance_asr_times()
@@ -102,13 +268,51 @@ def main():
     print_extraction_summary(extractor)
     
     # Step 6: Generate and save JSON
+    district_cities = None
+    if args.cities == "districts":
+        district_cities, _ = extractor.zone_mapper.expand_districts(extractor.get_prayer_times())
+    
+    output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
+    previous_data = load_json(output_path)
+    
     complete_data = generate_output_json(
         extractor.get_cities_data(),
-        extractor.get_prayer_times()
+        extractor.get_prayer_times(),
+        district_cities=district_cities,
+        previous=previous_data
     )
     
-    output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
-    save_json(complete_data, output_path)
+    # Patch against the previously published dataset so clients can skip full downloads
+    patch_chain = PatchChain(PATCH_DIR, max_versions=PATCH_HISTORY)
+    complete_data['dataset_version'] = patch_chain.record(previous_data, complete_data)
+    
+    if save_json(complete_data, output_path, compress=args.compress):
+        save_index(complete_data, output_path)
+    
+    if args.compact:
+        save_json(encode_dataset(complete_data), os.path.join(OUTPUT_DIR, COMPACT_FILENAME), compress=args.compress)
+    
+    if args.sqlite:
+        zone_numbers = {info['id']: zone for zone, info in extractor.zone_mapper.zone_mapping.items()}
+        SQLiteStore(os.path.join(OUTPUT_DIR, SQLITE_FILENAME)).save(
+            complete_data['cities'],
+            extractor.get_prayer_times(),
+            zone_numbers=zone_numbers,
+            full_run=not args.month
+        )
+    
+    if args.export:
+        exported = export_all(extractor.get_prayer_times(), EXPORT_DIR, args.export, extractor.get_block_years())
+        for fmt, path in exported.items():
+            print(f"📤 Exported {fmt.upper()} to {path}")
+    
+    if args.archive:
+        archive = ArchiveStore(os.path.join(OUTPUT_DIR, ARCHIVE_FILENAME)).load()
+        days = archive.ingest(extractor.get_prayer_times(), extractor.get_block_years())
+        print(f"🗄️ Archived {days} days")
+        archive.save()
+    
+    journal.complete()
     
     # Step 7: Cleanup temporary files
     if os.path.exists(DOWNLOAD_DIR):
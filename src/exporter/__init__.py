@@ -0,0 +1,6 @@
+"""Output format exporters."""
+
+from .formats import NDJSONExporter, CSVExporter, ICSExporter, iter_records, export_all
+from .zone_delta import encode_dataset, decode_dataset
+
+__all__ = ['NDJSONExporter', 'CSVExporter', 'ICSExporter', 'iter_records', 'export_all', 'encode_dataset', 'decode_dataset']
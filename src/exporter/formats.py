@@ -0,0 +1,211 @@
+"""Streaming exporters for NDJSON, CSV and iCalendar output."""
+
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config.settings import PRAYER_FIELDS, TIMEZONE, DATA_SOURCE
+from src.utils.date_utils import time_to_minutes
+
+CSV_COLUMNS = ['city', 'date', 'fajr', 'sunrise', 'luhar', 'asr_shafi', 'asr_hanafi', 'maghrib', 'isha']
+
+
+def iter_records(prayer_times: Dict[str, Dict], block_years: Optional[Dict[tuple, str]] = None,
+                 default_year: Optional[str] = None) -> Iterator[Tuple[str, str, Dict]]:
+    """
+    Yield (city, 'YYYY-MM-DD', prayer data) one day at a time.
+    
+    Records are ordered by city, then date. Only the keys are sorted; the
+    prayer data is yielded by reference, never copied.
+    
+    Args:
+        prayer_times: Dictionary of prayer times by city ('MM-DD' keys)
+        block_years: Year of each (city, month) block (None if unknown)
+        default_year: Year for blocks without one (defaults to this year)
+        
+    Yields:
+        Tuple of (city_id, full date, prayer data)
+    """
+    block_years = block_years or {}
+    default_year = default_year or str(datetime.now().year)
+    for city_id in sorted(prayer_times):
+        city_times = prayer_times[city_id]
+        for date in sorted(city_times):
+            year = block_years.get((city_id, date[:2])) or default_year
+            yield city_id, f"{year}-{date}", city_times[date]
+
+
+def _asr_values(prayer_data: Dict) -> Tuple[str, str]:
+    """Shafi and Hanafi ASR times, whether or not they have been enhanced."""
+    asr = prayer_data.get('asr', '')
+    if isinstance(asr, dict):
+        return asr.get('shafi', ''), asr.get('hanafi', '')
+    return asr, asr
+
+
+class NDJSONExporter:
+    """Write one JSON object per (city, date) line."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+    
+    def open(self):
+        self._file = open(self.path, 'w', encoding='utf-8', newline='\n')
+    
+    def write(self, city_id: str, date: str, prayer_data: Dict):
+        record = {'city': city_id, 'date': date, **prayer_data}
+        self._file.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + '\n')
+    
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class CSVExporter:
+    """Write one CSV row per (city, date)."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._writer = None
+    
+    def open(self):
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_COLUMNS)
+    
+    def write(self, city_id: str, date: str, prayer_data: Dict):
+        asr_shafi, asr_hanafi = _asr_values(prayer_data)
+        self._writer.writerow([
+            city_id, date,
+            prayer_data.get('fajr', ''), prayer_data.get('sunrise', ''), prayer_data.get('luhar', ''),
+            asr_shafi, asr_hanafi,
+            prayer_data.get('maghrib', ''), prayer_data.get('isha', '')
+        ])
+    
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class ICSExporter:
+    """
+    Write one iCalendar feed per city, one event per prayer.
+    
+    Records arrive grouped by city, so only the current city's feed is
+    open at any time.
+    """
+    
+    EVENT_MINUTES = 10
+    
+    def __init__(self, directory: str, dtstamp: Optional[str] = None):
+        self.directory = directory
+        self.dtstamp = dtstamp or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self._file = None
+        self._city_id = None
+    
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+    
+    def write(self, city_id: str, date: str, prayer_data: Dict):
+        if city_id != self._city_id:
+            self._close_feed()
+            self._open_feed(city_id)
+        
+        day = date.replace('-', '')
+        asr_shafi, asr_hanafi = _asr_values(prayer_data)
+        events = [(field, prayer_data.get(field, '')) for field in PRAYER_FIELDS if field != 'asr']
+        events.insert(3, ('asr', asr_shafi))
+        if asr_hanafi and asr_hanafi != asr_shafi:
+            events.insert(4, ('asr_hanafi', asr_hanafi))
+        
+        for name, value in events:
+            minutes = time_to_minutes(value, 'asr' if name == 'asr_hanafi' else name)
+            if minutes is None:
+                continue
+            title = 'Asr (Hanafi)' if name == 'asr_hanafi' else name.title()
+            self._lines(
+                "BEGIN:VEVENT",
+                f"UID:{city_id}-{date}-{name}@{DATA_SOURCE}",
+                f"DTSTAMP:{self.dtstamp}",
+                f"DTSTART;TZID={TIMEZONE}:{day}T{minutes // 60:02d}{minutes % 60:02d}00",
+                f"DURATION:PT{self.EVENT_MINUTES}M",
+                f"SUMMARY:{title}",
+                "TRANSP:TRANSPARENT",
+                "END:VEVENT"
+            )
+    
+    def close(self):
+        self._close_feed()
+    
+    def _open_feed(self, city_id: str):
+        self._city_id = city_id
+        self._file = open(os.path.join(self.directory, f"{city_id}.ics"), 'w', encoding='utf-8', newline='')
+        self._lines(
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:-//{DATA_SOURCE}//Prayer Times//EN",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:Prayer Times - {city_id.title()}",
+            f"X-WR-TIMEZONE:{TIMEZONE}",
+            "BEGIN:VTIMEZONE",
+            f"TZID:{TIMEZONE}",
+            "BEGIN:STANDARD",
+            "DTSTART:19700101T000000",
+            "TZOFFSETFROM:+0530",
+            "TZOFFSETTO:+0530",
+            "TZNAME:+0530",
+            "END:STANDARD",
+            "END:VTIMEZONE"
+        )
+    
+    def _close_feed(self):
+        if self._file:
+            self._lines("END:VCALENDAR")
+            self._file.close()
+            self._file = None
+        self._city_id = None
+    
+    def _lines(self, *lines: str):
+        self._file.write(''.join(line + '\r\n' for line in lines))
+
+
+def export_all(prayer_times: Dict[str, Dict], output_dir: str, formats: List[str],
+               block_years: Optional[Dict[tuple, str]] = None) -> Dict[str, str]:
+    """
+    Export prayer times to several formats in a single pass.
+    
+    Args:
+        prayer_times: Dictionary of prayer times by city ('MM-DD' keys)
+        output_dir: Directory for the exported files
+        formats: Any of 'ndjson', 'csv', 'ics'
+        block_years: Year of each (city, month) block
+        
+    Returns:
+        Dictionary of format to written path
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {
+        'ndjson': os.path.join(output_dir, 'prayer_times.ndjson'),
+        'csv': os.path.join(output_dir, 'prayer_times.csv'),
+        'ics': os.path.join(output_dir, 'ics'),
+    }
+    factories = {'ndjson': NDJSONExporter, 'csv': CSVExporter, 'ics': ICSExporter}
+    
+    exporters = [factories[fmt](paths[fmt]) for fmt in formats]
+    try:
+        for exporter in exporters:
+            exporter.open()
+        for city_id, date, prayer_data in iter_records(prayer_times, block_years):
+            for exporter in exporters:
+                exporter.write(city_id, date, prayer_data)
+    finally:
+        for exporter in exporters:
+            exporter.close()
+    
+    return {fmt: paths[fmt] for fmt in formats}
@@ -0,0 +1,302 @@
+"""Cross-zone delta encoding of the prayer times dataset.
+
+Neighbouring zones differ by a few, nearly constant minutes. The encoding
+stores one reference zone as minutes since midnight and every zone as a
+per-prayer offset from it, plus the days where the offset does not hold:
+
+    {"format": "zone-delta/1", "reference": "colombo",
+     "dates": ["01-01", ...], "fields": ["fajr", ..., "asr.shafi", ...],
+     "reference_times": {"fajr": [290, 291, ...]},
+     "zones": {"kandy": {"timezone": ..., "formats": {"fajr": "h:mm AM"},
+                         "offsets": {"fajr": 2},
+                         "exceptions": {"fajr": [[date index, extra minutes]]},
+                         "raw": {"fajr": [[date index, "original string"]]},
+                         "missing": [date indices], "days": {date: prayer data}}}}
+
+Every time is re-rendered in its zone's original format; strings that do
+not survive the round trip are kept verbatim in "raw", and days whose
+prayers do not match "fields" are kept whole in "days". decode_dataset()
+therefore reproduces the original dataset exactly.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional
+
+from config.settings import PRAYER_FIELDS
+from src.utils.date_utils import time_to_minutes
+
+FORMAT_NAME = "zone-delta/1"
+
+
+def _twelve_hour(minutes: int, padded: bool = False, suffix: Optional[str] = None) -> str:
+    hour, minute = divmod(minutes, 60)
+    text = f"{(hour - 1) % 12 + 1:0{2 if padded else 1}d}:{minute:02d}"
+    if suffix is None:
+        return text
+    return text + suffix + ('AM' if hour < 12 else 'PM')
+
+
+# Time string formats a column can be rendered back into
+TIME_FORMATS = {
+    'h:mm AM': lambda m: _twelve_hour(m, suffix=' '),
+    'h:mmAM': lambda m: _twelve_hour(m, suffix=''),
+    'h:mm am': lambda m: _twelve_hour(m, suffix=' ').lower(),
+    'h:mmam': lambda m: _twelve_hour(m, suffix='').lower(),
+    'hh:mm AM': lambda m: _twelve_hour(m, padded=True, suffix=' '),
+    'h:mm': lambda m: _twelve_hour(m),
+    'hh:mm': lambda m: _twelve_hour(m, padded=True),
+    'H:mm': lambda m: f"{m // 60}:{m % 60:02d}",
+    'HH:mm': lambda m: f"{m // 60:02d}:{m % 60:02d}",
+}
+
+
+def _flatten(prayer_data: Dict) -> Dict[str, str]:
+    """{'asr': {'shafi': x}} -> {'asr.shafi': x}."""
+    flat = {}
+    for prayer, value in prayer_data.items():
+        if isinstance(value, dict):
+            for school, time_str in value.items():
+                flat[f"{prayer}.{school}"] = time_str
+        else:
+            flat[prayer] = value
+    return flat
+
+
+def _unflatten(flat: Dict[str, str]) -> Dict:
+    prayer_data = {}
+    for field, value in flat.items():
+        prayer, _, school = field.partition('.')
+        if school:
+            prayer_data.setdefault(prayer, {})[school] = value
+        else:
+            prayer_data[prayer] = value
+    return prayer_data
+
+
+def _field_order(field: str) -> tuple:
+    prayer = field.partition('.')[0]
+    return (PRAYER_FIELDS.index(prayer) if prayer in PRAYER_FIELDS else len(PRAYER_FIELDS), field)
+
+
+def _detect_format(values: List[str], minutes: List[Optional[int]]) -> Optional[str]:
+    """Name of the format that reproduces most of the values."""
+    parseable = sum(1 for m in minutes if m is not None)
+    best, best_hits = None, 0
+    for name, render in TIME_FORMATS.items():
+        hits = sum(1 for value, m in zip(values, minutes) if m is not None and render(m) == value)
+        if hits > best_hits:
+            best, best_hits = name, hits
+        if hits == parseable:
+            break
+    return best
+
+
+def _zone_minutes(city_times: Dict[str, Dict], dates: List[str], fields: List[str]):
+    """
+    Split a zone into minute columns, verbatim strings and irregular days.
+    
+    Returns:
+        Tuple of (formats, {field: [minutes or None per date]},
+        {field: [[index, string]]}, missing indices, {date: prayer data})
+    """
+    columns = {field: [None] * len(dates) for field in fields}
+    raw = {}
+    missing = []
+    days = {}
+    field_set = set(fields)
+    
+    flat_days = {}
+    for index, date in enumerate(dates):
+        prayer_data = city_times.get(date)
+        if prayer_data is None:
+            missing.append(index)
+            continue
+        flat = _flatten(prayer_data)
+        if set(flat) != field_set:
+            days[date] = prayer_data
+            continue
+        flat_days[index] = flat
+    
+    formats = {}
+    for field in fields:
+        prayer = field.partition('.')[0]
+        values = [flat[field] for flat in flat_days.values()]
+        parsed = [time_to_minutes(value, prayer) for value in values]
+        formats[field] = _detect_format(values, parsed)
+        render = TIME_FORMATS.get(formats[field])
+        for index, value, minutes in zip(flat_days, values, parsed):
+            if render and minutes is not None and render(minutes) == value:
+                columns[field][index] = minutes
+            else:
+                raw.setdefault(field, []).append([index, value])
+    
+    return formats, columns, raw, missing, days
+
+
+def _encode_zone(columns: Dict[str, List], reference: Dict[str, List], raw: Dict[str, List]) -> tuple:
+    """Per-field offsets from the reference plus their exceptions."""
+    offsets = {}
+    exceptions = {}
+    for field, values in columns.items():
+        deltas = Counter(
+            value - ref for value, ref in zip(values, reference[field])
+            if value is not None and ref is not None
+        )
+        offset = deltas.most_common(1)[0][0] if deltas else 0
+        offsets[field] = offset
+        for index, (value, ref) in enumerate(zip(values, reference[field])):
+            if value is None:
+                continue
+            if ref is None:
+                # Nothing to offset from; keep the minutes as an absolute exception
+                raw.setdefault(field, []).append([index, value])
+            elif value - ref != offset:
+                exceptions.setdefault(field, []).append([index, value - ref - offset])
+        if field in raw:
+            raw[field].sort(key=lambda entry: entry[0])
+    return offsets, exceptions
+
+
+def encode_prayer_times(prayer_times: Dict[str, Dict], reference: Optional[str] = None) -> Dict:
+    """
+    Encode the 'prayer_times' section of a dataset against a reference zone.
+    
+    Args:
+        prayer_times: Dictionary of city ID to {'timezone', 'times'}
+        reference: Reference zone city ID; by default the zone the others
+            need the fewest exceptions against
+            
+    Returns:
+        Encoded dictionary (see module docstring)
+    """
+    dates = sorted({date for block in prayer_times.values() for date in block.get('times', {})})
+    field_counts = Counter(
+        field
+        for block in prayer_times.values()
+        for prayer_data in block.get('times', {}).values()
+        for field in _flatten(prayer_data)
+    )
+    fields = sorted(field_counts, key=_field_order)
+    
+    split = {
+        city_id: _zone_minutes(block.get('times', {}), dates, fields)
+        for city_id, block in prayer_times.items()
+    }
+    
+    if reference is None or reference not in split:
+        reference = min(split, key=lambda candidate: _exception_count(split, candidate)) if split else None
+    reference_times = split[reference][1] if reference else {}
+    
+    zones = {}
+    for city_id in sorted(split):
+        formats, columns, raw, missing, days = split[city_id]
+        offsets, exceptions = _encode_zone(columns, reference_times, raw)
+        zone = {'timezone': prayer_times[city_id].get('timezone'), 'formats': formats, 'offsets': offsets}
+        if exceptions:
+            zone['exceptions'] = exceptions
+        if raw:
+            zone['raw'] = raw
+        if missing:
+            zone['missing'] = missing
+        if days:
+            zone['days'] = days
+        zones[city_id] = zone
+    
+    return {
+        'format': FORMAT_NAME,
+        'reference': reference,
+        'dates': dates,
+        'fields': fields,
+        'reference_times': reference_times,
+        'zones': zones
+    }
+
+
+def _exception_count(split: Dict[str, tuple], candidate: str) -> int:
+    reference = split[candidate][1]
+    total = 0
+    for _, columns, *_ in split.values():
+        for field, values in columns.items():
+            deltas = Counter(
+                value - ref for value, ref in zip(values, reference[field])
+                if value is not None and ref is not None
+            )
+            total += sum(deltas.values()) - (deltas.most_common(1)[0][1] if deltas else 0)
+    return total
+
+
+def decode_prayer_times(encoded: Dict) -> Dict[str, Dict]:
+    """
+    Rebuild the 'prayer_times' section from its zone-delta encoding.
+    
+    Args:
+        encoded: Output of encode_prayer_times
+        
+    Returns:
+        Dictionary of city ID to {'timezone', 'times'}
+    """
+    if encoded.get('format') != FORMAT_NAME:
+        raise ValueError(f"Unsupported prayer times encoding: {encoded.get('format')}")
+    
+    dates = encoded['dates']
+    fields = encoded['fields']
+    reference = encoded['reference_times']
+    prayer_times = {}
+    
+    for city_id, zone in encoded['zones'].items():
+        missing = set(zone.get('missing', []))
+        days = zone.get('days', {})
+        columns = {}
+        for field in fields:
+            offset = zone['offsets'][field]
+            render = TIME_FORMATS.get(zone['formats'][field])
+            column = [
+                render(ref + offset) if ref is not None and render else None
+                for ref in reference[field]
+            ]
+            for index, extra in zone.get('exceptions', {}).get(field, []):
+                column[index] = render(reference[field][index] + offset + extra)
+            for index, value in zone.get('raw', {}).get(field, []):
+                column[index] = render(value) if isinstance(value, int) else value
+            columns[field] = column
+        
+        times = {}
+        for index, date in enumerate(dates):
+            if date in days:
+                times[date] = days[date]
+            elif index not in missing:
+                times[date] = _unflatten({field: columns[field][index] for field in fields})
+        prayer_times[city_id] = {'timezone': zone['timezone'], 'times': times}
+    
+    return prayer_times
+
+
+def encode_dataset(dataset: Dict, reference: Optional[str] = None) -> Dict:
+    """
+    Compact copy of a dataset with its prayer times zone-delta encoded.
+    
+    Args:
+        dataset: Dataset as produced by generate_output_json
+        reference: Optional reference zone city ID
+        
+    Returns:
+        Dataset with 'prayer_times' replaced by 'prayer_times_delta'
+    """
+    compact = {key: value for key, value in dataset.items() if key != 'prayer_times'}
+    compact['prayer_times_delta'] = encode_prayer_times(dataset.get('prayer_times', {}), reference)
+    return compact
+
+
+def decode_dataset(compact: Dict) -> Dict:
+    """
+    Expand a dataset written by encode_dataset back to the full format.
+    
+    Args:
+        compact: Output of encode_dataset
+        
+    Returns:
+        Dataset identical to the one that was encoded
+    """
+    dataset = {key: value for key, value in compact.items() if key != 'prayer_times_delta'}
+    dataset['prayer_times'] = decode_prayer_times(compact['prayer_times_delta'])
+    return dataset
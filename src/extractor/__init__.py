@@ -3,5 +3,7 @@
 from .time_extractor import PrayerTimesExtractor
 from .pdf_parser import PDFParser
 from .zone_mapper import ZoneMapper
+from .validator import BlockValidator
+from .engines import PlumberTableEngine, PositionalEngine, create_engine
 
-__all__ = ['PrayerTimesExtractor', 'PDFParser', 'ZoneMapper']
\ No newline at end of file
+__all__ = ['PrayerTimesExtractor', 'PDFParser', 'ZoneMapper', 'BlockValidator', 'PlumberTableEngine', 'PositionalEngine', 'create_engine']
\ No newline at end of file
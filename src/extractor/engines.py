@@ -0,0 +1,184 @@
+"""Table extraction engines for PDF pages."""
+
+from typing import Dict, Iterator, List, Optional
+
+from pdfminer.layout import LTChar, LTContainer
+
+# Header words of the 7-column ACJU grid, by column
+COLUMN_HEADERS = [
+    ("DATE",),
+    ("FAJR", "SUBAH", "SUBH"),
+    ("SUNRISE", "SHURUQ"),
+    ("LUHAR", "LUHR", "ZUHR", "DHUHR", "DUHR"),
+    ("ASR",),
+    ("MAGHRIB",),
+    ("ISHA",),
+]
+
+
+class PlumberTableEngine:
+    """pdfplumber's table finder: robust, but the slowest stage of the pipeline."""
+    
+    name = "plumber"
+    # Pages are extracted independently, so page workers can split them
+    stateless = True
+    
+    def extract_page(self, page) -> List[List[List]]:
+        """
+        Extract the tables of one page.
+        
+        Args:
+            page: pdfplumber Page
+            
+        Returns:
+            List of tables (lists of rows)
+        """
+        return page.extract_tables() or []
+
+
+class PositionalEngine:
+    """
+    Rebuild the 7-column prayer table from word positions.
+    
+    Characters are read once from the page's pdfminer layout (skipping
+    pdfplumber's per-object conversion and its ruling line detection),
+    grouped into lines and words by position, and each word is assigned to
+    the Date/Fajr/Sunrise/Luhar/Asr/Maghrib/Isha column whose header is
+    horizontally closest. The result is the same header-plus-rows table
+    parse_table_rows() expects from the table finder.
+    """
+    
+    name = "positional"
+    # Continuation pages reuse the columns of an earlier page's header
+    stateless = False
+    
+    def __init__(self, line_tolerance: float = 3.0, word_gap: float = 3.0):
+        self.line_tolerance = line_tolerance
+        self.word_gap = word_gap
+        # Columns of the last header seen, for continuation pages without one
+        self._boundaries = None
+    
+    def extract_page(self, page) -> List[List[List]]:
+        """
+        Extract the prayer table of one page.
+        
+        Args:
+            page: pdfplumber Page
+            
+        Returns:
+            A list with one table, or an empty list if no grid was found
+        """
+        lines = self._group_lines(self._iter_chars(page.layout))
+        
+        header, start = None, 0
+        for i, words in enumerate(lines):
+            boundaries = self._header_boundaries(words)
+            if boundaries:
+                self._boundaries = boundaries
+                header, start = self._split_line(words, boundaries), i + 1
+                break
+        
+        if self._boundaries is None:
+            return []
+        if header is None:
+            # Continuation page: reuse the previous header's columns. Title
+            # lines have no parsable date, so parse_table_rows drops them.
+            header = [headers[0].title() for headers in COLUMN_HEADERS]
+        
+        rows = [self._split_line(words, self._boundaries) for words in lines[start:]]
+        table = [header] + [row for row in rows if any(row)]
+        return [table] if len(table) > 1 else []
+    
+    def _iter_chars(self, container) -> Iterator[LTChar]:
+        for obj in container:
+            if isinstance(obj, LTChar):
+                yield obj
+            elif isinstance(obj, LTContainer):
+                yield from self._iter_chars(obj)
+    
+    def _group_lines(self, chars) -> List[List[Dict]]:
+        """Cluster characters into lines (top to bottom) of words (left to right)."""
+        lines = []
+        current, current_top = [], None
+        # pdfminer's y axis points up, so the top of the page has the largest y1
+        for char in sorted(chars, key=lambda c: (-round(c.y1), c.x0)):
+            if current and abs(char.y1 - current_top) > self.line_tolerance:
+                lines.append(self._words(current))
+                current = []
+            if not current:
+                current_top = char.y1
+            current.append(char)
+        if current:
+            lines.append(self._words(current))
+        return [words for words in lines if words]
+    
+    def _words(self, chars: List[LTChar]) -> List[Dict]:
+        """Split one line's characters into words at whitespace and gaps."""
+        words = []
+        text, x0, x1 = [], None, None
+        for char in sorted(chars, key=lambda c: c.x0):
+            glyph = char.get_text()
+            if glyph.isspace() or (text and char.x0 - x1 > self.word_gap):
+                if text:
+                    words.append({'text': ''.join(text), 'x0': x0, 'x1': x1})
+                text = []
+                if glyph.isspace():
+                    continue
+            if not text:
+                x0 = char.x0
+            text.append(glyph)
+            x1 = char.x1
+        if text:
+            words.append({'text': ''.join(text), 'x0': x0, 'x1': x1})
+        return words
+    
+    @staticmethod
+    def _header_boundaries(words: List[Dict]) -> Optional[List[float]]:
+        """
+        Column boundaries if the line is the table header.
+        
+        Returns:
+            The 6 x positions separating the 7 columns, or None
+        """
+        centers = [None] * len(COLUMN_HEADERS)
+        for word in words:
+            text = word['text'].strip(' .:').upper()
+            for column, headers in enumerate(COLUMN_HEADERS):
+                if text in headers and centers[column] is None:
+                    centers[column] = (word['x0'] + word['x1']) / 2
+                    break
+        
+        if any(center is None for center in centers) or centers != sorted(centers):
+            return None
+        return [(left + right) / 2 for left, right in zip(centers, centers[1:])]
+    
+    @staticmethod
+    def _split_line(words: List[Dict], boundaries: List[float]) -> List[str]:
+        """Join the words of a line into one cell per column."""
+        cells = [[] for _ in range(len(boundaries) + 1)]
+        for word in words:
+            center = (word['x0'] + word['x1']) / 2
+            column = sum(1 for boundary in boundaries if center >= boundary)
+            cells[column].append(word['text'])
+        return [' '.join(cell) for cell in cells]
+
+
+ENGINES = {
+    PlumberTableEngine.name: PlumberTableEngine,
+    PositionalEngine.name: PositionalEngine,
+}
+
+
+def create_engine(name: str):
+    """
+    Create a table engine by name.
+    
+    Args:
+        name: 'plumber' or 'positional'
+        
+    Returns:
+        Engine instance
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown PDF engine: {name} (expected one of {', '.join(ENGINES)})")
+    return ENGINES[name]()
@@ -2,25 +2,76 @@
 
 import re
 import pdfplumber
-from typing import Tuple, List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple, List, Dict, Iterable, Optional
 
+from config.settings import PAGE_WORKERS
+from src.extractor.engines import create_engine
 from src.utils.text_utils import extract_zone_from_text, extract_month_from_text, clean_time
 from src.utils.date_utils import parse_date
 
 
+def _extract_page_tables(pdf_path: str, page_numbers: List[int], low_memory: bool,
+                         engine: str = "plumber") -> List[Tuple[int, List[List]]]:
+    """
+    Extract the tables of some pages (runs in a page worker process).
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_numbers: Zero-based page numbers
+        low_memory: Release every page once its tables are read
+        engine: Table engine name (see src.extractor.engines)
+        
+    Returns:
+        List of (page_number, table) tuples in page order
+    """
+    page_tables = []
+    table_engine = create_engine(engine)
+    with pdfplumber.open(pdf_path, pages=[n + 1 for n in page_numbers]) as pdf:
+        for page in pdf.pages:
+            tables = table_engine.extract_page(page)
+            if low_memory:
+                page.close()
+            page_tables.extend((page.page_number - 1, table) for table in tables or [])
+    return page_tables
+
+
 class PDFParser:
     """Parse prayer times from PDF files."""
     
+    def __init__(self, low_memory: bool = False, page_workers: int = PAGE_WORKERS, governor=None):
+        # In low-memory mode every page is released as soon as it is used
+        # and text is only read as far as the metadata requires
+        self.low_memory = low_memory
+        # With more than one page worker, multi-page PDFs have their
+        # tables extracted by a process pool, one page range per worker
+        self.page_workers = max(1, page_workers or 1)
+        self.governor = governor
+        self._pool = None
+    
+    def close(self):
+        """Shut down the page worker pool, if one was started."""
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+    
     def extract_text_and_metadata(self, pdf_path: str) -> Tuple[str, str, str]:
         """
         Extract all text and identify zone and month.
         
+        In low-memory mode reading stops at the first page that completes
+        the zone and month, so the returned text may be partial.
+        
         Args:
             pdf_path: Path to PDF file
             
         Returns:
             Tuple of (all_text, zone, month)
         """
+        if self.low_memory:
+            return self._extract_metadata_incrementally(pdf_path)
+        
         with pdfplumber.open(pdf_path) as pdf:
             all_text = ""
             for page in pdf.pages:
@@ -32,6 +83,26 @@ class PDFParser:
             
             return all_text, zone, month
     
+    def _extract_metadata_incrementally(self, pdf_path: str) -> Tuple[str, str, str]:
+        """Read pages one at a time until both zone and month are known."""
+        text_parts = []
+        zone, month = None, None
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text() or ""
+                self._release(page)
+                text_parts.append(page_text)
+                zone = zone or extract_zone_from_text(page_text)
+                month = month or extract_month_from_text(page_text)
+                if zone and month:
+                    break
+        return "\n".join(text_parts) + "\n", zone, month
+    
+    def _release(self, page):
+        """Flush a page's parsed objects and caches in low-memory mode."""
+        if self.low_memory:
+            page.close()
+    
     def extract_tables(self, pdf_path: str) -> List[List[List]]:
         """
         Extract all tables from PDF.
@@ -42,13 +113,78 @@ class PDFParser:
         Returns:
             List of tables from all pages
         """
-        all_tables = []
+        return [table for _, table in self.extract_tables_by_page(pdf_path)]
+    
+    def extract_tables_by_page(self, pdf_path: str, engine: str = "plumber") -> List[Tuple[int, List[List]]]:
+        """
+        Extract all tables from PDF, keeping track of their source page.
+        
+        Args:
+            pdf_path: Path to PDF file
+            engine: Table engine: 'plumber' (pdfplumber's table finder) or
+                'positional' (word positions clustered into the 7 columns)
+                
+        Returns:
+            List of (page_number, table) tuples in page order
+        """
+        table_engine = create_engine(engine)
+        # Engines that carry state from page to page need every page in order
+        if self.page_workers > 1 and table_engine.stateless:
+            with pdfplumber.open(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+            if page_count > 1:
+                try:
+                    return self._extract_tables_in_parallel(pdf_path, page_count, engine)
+                except BrokenProcessPool as e:
+                    print(f"    ⚠ Page workers failed ({e}); extracting sequentially")
+                    self.close()
+        
+        page_tables = []
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
+            for page_number, page in enumerate(pdf.pages):
+                tables = table_engine.extract_page(page)
+                self._release(page)
                 if tables:
-                    all_tables.extend(tables)
-        return all_tables
+                    page_tables.extend((page_number, table) for table in tables)
+        return page_tables
+    
+    def _extract_tables_in_parallel(self, pdf_path: str, page_count: int, engine: str) -> List[Tuple[int, List[List]]]:
+        """Split the pages into contiguous ranges, one per worker, and merge in page order."""
+        workers = min(self.page_workers, page_count)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.page_workers)
+        
+        size = -(-page_count // workers)
+        futures = []
+        for start in range(0, page_count, size):
+            if self.governor:
+                # Counts the workers' memory too; waits on ranges already submitted
+                self.governor.wait_for_headroom(futures)
+            page_numbers = list(range(start, min(start + size, page_count)))
+            futures.append(self._pool.submit(_extract_page_tables, pdf_path, page_numbers, self.low_memory, engine))
+        
+        # Ranges are contiguous and submitted in order, so concatenating keeps page order
+        return [page_table for future in futures for page_table in future.result()]
+    
+    def extract_page_texts(self, pdf_path: str, page_numbers: Optional[Iterable[int]] = None) -> Dict[int, str]:
+        """
+        Extract text from selected pages only.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: Zero-based page numbers, or None for every page
+            
+        Returns:
+            Dictionary of page number to page text
+        """
+        texts = {}
+        # pdfplumber only builds Page objects for the requested (1-based) pages
+        pages = None if page_numbers is None else sorted({n + 1 for n in page_numbers if n >= 0})
+        with pdfplumber.open(pdf_path, pages=pages) as pdf:
+            for page in pdf.pages:
+                texts[page.page_number - 1] = page.extract_text() or ""
+                self._release(page)
+        return texts
     
     def parse_table_rows(self, table: List[List], month: str) -> List[Dict]:
         """
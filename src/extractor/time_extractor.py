@@ -1,19 +1,27 @@
 """Main prayer times extractor orchestrator."""
 
 from collections import defaultdict
-from typing import Tuple
+from typing import Tuple, Dict
 
+from config.settings import PAGE_WORKERS, PDF_ENGINE, AUTO_ENGINE_ORDER
 from src.extractor.pdf_parser import PDFParser
 from src.extractor.zone_mapper import ZoneMapper
+from src.extractor.validator import BlockValidator
+from src.utils.text_utils import extract_year_from_text
 
 
 class PrayerTimesExtractor:
     """Orchestrates extraction of prayer times from PDFs."""
     
-    def __init__(self):
-        self.pdf_parser = PDFParser()
+    def __init__(self, low_memory: bool = False, page_workers: int = PAGE_WORKERS, governor=None,
+                 engine: str = PDF_ENGINE):
+        self.pdf_parser = PDFParser(low_memory=low_memory, page_workers=page_workers, governor=governor)
+        self.engine = engine
         self.zone_mapper = ZoneMapper()
+        self.validator = BlockValidator()
         self.all_prayer_times = defaultdict(lambda: defaultdict(dict))
+        self.validation_reports = {}
+        self.block_years = {}
     
     def extract_from_pdf(self, pdf_path: str, filename: str) -> Tuple[str, str, int]:
         """
@@ -35,6 +43,7 @@ class PrayerTimesExtractor:
                 return None, None, 0
             
             print(f"    ✓ Zone: {zone}, Month: {month}")
+            year = extract_year_from_text(all_text)
             
             # Map zone to city
             city_id = self.zone_mapper.build_zone_mapping(zone, filename)
@@ -42,34 +51,36 @@ class PrayerTimesExtractor:
                 print(f"    ❌ Could not identify city")
                 return None, None, 0
             
-            records_count = 0
-            
             # METHOD 1: Table extraction
-            tables = self.pdf_parser.extract_tables(pdf_path)
-            print(f"    📊 Found {len(tables)} tables")
+            block, date_pages = self._extract_table_block(pdf_path, month)
             
-            for table_idx, table in enumerate(tables):
-                prayer_times = self.pdf_parser.parse_table_rows(table, month)
-                for prayer_data in prayer_times:
-                    date = prayer_data.pop("date")
-                    self.all_prayer_times[city_id][date] = prayer_data
-                    records_count += 1
+            # Validate the whole block and re-parse only the pages that failed
+            if block:
+                block = self._repair_block(pdf_path, block, date_pages, city_id, month)
             
             # METHOD 2: Text-based fallback
-            if records_count == 0:
+            if not block:
                 print(f"    ⚠ Trying text extraction...")
+                if self.pdf_parser.low_memory:
+                    # Only part of the text was kept; read the rest now that it is needed
+                    all_text = "\n".join(self.pdf_parser.extract_page_texts(pdf_path).values())
                 prayer_times = self.pdf_parser.extract_from_text_pattern(all_text, month)
                 
                 for prayer_data in prayer_times:
                     date = prayer_data.pop("date")
-                    self.all_prayer_times[city_id][date] = prayer_data
-                    records_count += 1
+                    block[date] = prayer_data
                 
-                if records_count > 0:
-                    print(f"    ✓ Extracted {records_count} records from text")
+                if block:
+                    print(f"    ✓ Extracted {len(block)} records from text")
+                    self.validation_reports[(city_id, month)] = self.validator.validate(block, month)
                 else:
                     print(f"    ❌ No records found")
             
+            self.all_prayer_times[city_id].update(block)
+            # None when the PDF does not state its year; only exporters guess one
+            self.block_years[(city_id, month)] = year
+            records_count = len(block)
+            
             print(f"    📊 Total records: {records_count}")
             return zone, month, records_count
             
@@ -77,6 +88,115 @@ class PrayerTimesExtractor:
             print(f"    ❌ Error: {e}")
             return None, None, 0
     
+    def _extract_table_block(self, pdf_path: str, month: str) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+        """
+        Extract the month block with the configured table engine.
+        
+        In 'auto' mode the engines of AUTO_ENGINE_ORDER are tried in turn
+        (fastest first) until one yields a block that validates; otherwise
+        the largest block found is used.
+        
+        Args:
+            pdf_path: Path to PDF file
+            month: Month number (01-12)
+            
+        Returns:
+            Tuple of (block, mapping of 'MM-DD' date to source page)
+        """
+        engines = AUTO_ENGINE_ORDER if self.engine == "auto" else [self.engine]
+        best_block, best_pages = {}, {}
+        
+        for engine in engines:
+            page_tables = self.pdf_parser.extract_tables_by_page(pdf_path, engine=engine)
+            print(f"    📊 Found {len(page_tables)} tables ({engine})")
+            
+            block = {}
+            date_pages = {}
+            for page_number, table in page_tables:
+                prayer_times = self.pdf_parser.parse_table_rows(table, month)
+                for prayer_data in prayer_times:
+                    date = prayer_data.pop("date")
+                    block[date] = prayer_data
+                    date_pages[date] = page_number
+            
+            if block and self.validator.validate(block, month)["valid"]:
+                return block, date_pages
+            if len(block) > len(best_block):
+                best_block, best_pages = block, date_pages
+        
+        return best_block, best_pages
+    
+    def _repair_block(self, pdf_path: str, block: Dict[str, Dict], date_pages: Dict[str, int],
+                      city_id: str, month: str) -> Dict[str, Dict]:
+        """
+        Validate a (city, month) block and re-extract failing rows from text.
+        
+        Only the pages holding bad rows (or the neighbours of missing days)
+        are re-read with the slower text path.
+        
+        Args:
+            pdf_path: Path to PDF file
+            block: Mapping of 'MM-DD' date to prayer data from the table pass
+            date_pages: Mapping of 'MM-DD' date to the page it was parsed from
+            city_id: City the block belongs to
+            month: Month number (01-12)
+            
+        Returns:
+            Repaired block
+        """
+        report = self.validator.validate(block, month)
+        if report["valid"]:
+            self.validation_reports[(city_id, month)] = report
+            return block
+        
+        print(f"    ⚠ Validation failed: {'; '.join(report['issues'])}")
+        targets = set(report["missing_dates"]) | set(report["bad_dates"]) | set(report["suspect_dates"])
+        pages = self._pages_for_dates(targets, date_pages)
+        
+        repaired = 0
+        texts = self.pdf_parser.extract_page_texts(pdf_path, pages)
+        for page_number in sorted(texts):
+            for prayer_data in self.pdf_parser.extract_from_text_pattern(texts[page_number], month):
+                date = prayer_data.pop("date")
+                if date in targets and self.validator.check_row(prayer_data):
+                    block[date] = prayer_data
+                    targets.discard(date)
+                    repaired += 1
+        
+        # Rows that are still internally inconsistent are worse than no rows
+        for date in report["bad_dates"]:
+            if date in targets:
+                block.pop(date, None)
+        
+        report = self.validator.validate(block, month)
+        self.validation_reports[(city_id, month)] = report
+        page_label = "all pages" if pages is None else f"{len(pages)} page(s)"
+        print(f"    ✓ Re-extracted {repaired} row(s) from {page_label}")
+        if not report["valid"]:
+            print(f"    ⚠ Still failing: {'; '.join(report['issues'])}")
+        return block
+    
+    @staticmethod
+    def _pages_for_dates(dates, date_pages: Dict[str, int]):
+        """Pages holding the given dates, or None when any cannot be located."""
+        pages = set()
+        for date in dates:
+            if date in date_pages:
+                pages.add(date_pages[date])
+                continue
+            # Missing day: look on the pages of the days around it
+            month, day = date.split("-")
+            neighbours = [f"{month}-{int(day) + offset:02d}" for offset in (-1, 1)]
+            found = {date_pages[n] for n in neighbours if n in date_pages}
+            if not found:
+                return None
+            pages.update(found)
+        return sorted(pages)
+    
+    def close(self):
+        """Release the PDF parser's page workers."""
+        self.pdf_parser.close()
+    
     def enhance_asr_times(self):
         """Convert ASR times to Shafi/Hanafi structure."""
         for city_id in self.all_prayer_times:
@@ -94,4 +214,47 @@ class PrayerTimesExtractor:
     
     def get_prayer_times(self):
         """Get all extracted prayer times."""
-        return self.all_prayer_times
\ No newline at end of file
+        return self.all_prayer_times
+    
+    def get_month_block(self, zone: str, month: str) -> Dict[str, Dict]:
+        """
+        Get the extracted times of one zone and month.
+        
+        Args:
+            zone: Zone number
+            month: Month number (01-12)
+            
+        Returns:
+            Dictionary of 'MM-DD' date to prayer data
+        """
+        city_info = self.zone_mapper.get_city_info(zone)
+        if not city_info:
+            return {}
+        city_times = self.all_prayer_times.get(city_info['id'], {})
+        return {date: data for date, data in city_times.items() if date.startswith(f"{month}-")}
+    
+    def restore_block(self, filename: str, zone: str, month: str, year: str, times: Dict[str, Dict]) -> int:
+        """
+        Merge a previously extracted block without re-parsing its PDF.
+        
+        Args:
+            filename: Name of PDF file
+            zone: Zone number
+            month: Month number (01-12)
+            year: Gregorian year of the block (None if unknown)
+            times: Dictionary of 'MM-DD' date to prayer data
+            
+        Returns:
+            Number of records restored
+        """
+        city_id = self.zone_mapper.build_zone_mapping(zone, filename)
+        if not city_id:
+            return 0
+        for date, prayer_data in times.items():
+            self.all_prayer_times[city_id][date] = dict(prayer_data)
+        self.block_years[(city_id, month)] = year
+        return len(times)
+    
+    def get_block_years(self):
+        """Get the Gregorian year of each extracted (city, month) block (None if unknown)."""
+        return self.block_years
\ No newline at end of file
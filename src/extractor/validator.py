@@ -0,0 +1,147 @@
+"""Validation of extracted prayer time blocks."""
+
+from typing import Dict, List, Optional, Set
+
+from config.settings import PRAYER_FIELDS, MAX_DAILY_DELTA_MINUTES
+from src.utils.date_utils import time_to_minutes, days_in_month
+
+REQUIRED_FIELDS = ("fajr", "maghrib", "isha")
+
+
+class BlockValidator:
+    """Validate a (city, month) block of prayer times as a whole."""
+    
+    def __init__(self, max_daily_delta: int = MAX_DAILY_DELTA_MINUTES):
+        self.max_daily_delta = max_daily_delta
+    
+    def to_columns(self, block: Dict[str, Dict]) -> Dict[str, List[Optional[int]]]:
+        """
+        Convert a block into per-prayer columns of minutes since midnight.
+        
+        Args:
+            block: Mapping of 'MM-DD' date to prayer data
+            
+        Returns:
+            Dictionary with a 'date' column plus one column per prayer,
+            all ordered by date
+        """
+        dates = sorted(block)
+        columns = {"date": dates}
+        for field in PRAYER_FIELDS:
+            columns[field] = [
+                time_to_minutes(self._field_value(block[date], field), field)
+                for date in dates
+            ]
+        return columns
+    
+    def check_row(self, prayer_data: Dict) -> bool:
+        """
+        Check a single row in isolation: required fields and prayer order.
+        
+        Args:
+            prayer_data: Prayer data for one day
+            
+        Returns:
+            True if the row is internally consistent
+        """
+        minutes = []
+        for field in PRAYER_FIELDS:
+            value = self._field_value(prayer_data, field)
+            parsed = time_to_minutes(value, field)
+            if parsed is None and (value or field in REQUIRED_FIELDS):
+                return False
+            minutes.append(parsed)
+        return self._is_ordered(minutes)
+    
+    def validate(self, block: Dict[str, Dict], month: str) -> Dict:
+        """
+        Validate day coverage, prayer ordering and day-to-day deltas.
+        
+        Args:
+            block: Mapping of 'MM-DD' date to prayer data
+            month: Month number (01-12)
+            
+        Returns:
+            Report dictionary with 'valid', 'missing_dates', 'bad_dates',
+            'suspect_dates' and human-readable 'issues'
+        """
+        columns = self.to_columns(block)
+        dates = columns["date"]
+        issues = []
+        
+        # Coverage: every day of the month exactly once, nothing from other months
+        expected = {f"{month}-{day:02d}" for day in range(1, days_in_month(month) + 1)}
+        missing = sorted(expected - set(dates))
+        if month == "02" and missing == [f"{month}-29"]:
+            missing = []  # non-leap-year table
+        foreign = {date for date in dates if date not in expected}
+        if missing:
+            issues.append(f"missing {len(missing)} day(s)")
+        if foreign:
+            issues.append(f"{len(foreign)} date(s) outside month {month}")
+        
+        # Ordering: each row must run Fajr < Sunrise < ... < Isha
+        rows = list(zip(*(columns[field] for field in PRAYER_FIELDS)))
+        bad = {
+            date for date, row, prayer_data in zip(dates, rows, (block[d] for d in dates))
+            if not self._row_complete(row, prayer_data) or not self._is_ordered(row)
+        }
+        if bad:
+            issues.append(f"{len(bad)} row(s) out of order or unparseable")
+        
+        # Deltas: neighbouring days should differ by a few minutes at most
+        suspect = self._delta_outliers(dates, columns) - bad
+        if suspect:
+            issues.append(f"{len(suspect)} row(s) with implausible day-to-day jumps")
+        
+        return {
+            "valid": not issues,
+            "missing_dates": missing,
+            "bad_dates": sorted(bad | foreign),
+            "suspect_dates": sorted(suspect),
+            "issues": issues,
+        }
+    
+    def _delta_outliers(self, dates: List[str], columns: Dict[str, List]) -> Set[str]:
+        """Find dates whose times jump too far from adjacent days."""
+        days = [int(date.split("-")[1]) for date in dates]
+        broken_edges = set()
+        for field in PRAYER_FIELDS:
+            column = columns[field]
+            for i, (prev, curr) in enumerate(zip(column, column[1:])):
+                if prev is None or curr is None:
+                    continue
+                gap = max(days[i + 1] - days[i], 1)
+                if abs(curr - prev) > self.max_daily_delta * gap:
+                    broken_edges.add(i)
+        
+        # A lone bad row breaks both of its edges; otherwise blame both ends
+        flagged = set()
+        for i in range(len(dates)):
+            before = (i - 1) in broken_edges
+            after = i in broken_edges
+            if before and after:
+                flagged.add(i)
+        for edge in broken_edges:
+            if edge not in flagged and edge + 1 not in flagged:
+                flagged.update((edge, edge + 1))
+        return {dates[i] for i in flagged}
+    
+    @staticmethod
+    def _field_value(prayer_data: Dict, field: str) -> str:
+        value = prayer_data.get(field, "")
+        if isinstance(value, dict):
+            value = value.get("shafi", "")
+        return value
+    
+    @staticmethod
+    def _row_complete(row, prayer_data: Dict) -> bool:
+        for field, minutes in zip(PRAYER_FIELDS, row):
+            if minutes is None and (prayer_data.get(field) or field in REQUIRED_FIELDS):
+                return False
+        return True
+    
+    @staticmethod
+    def _is_ordered(row) -> bool:
+        present = [minutes for minutes in row if minutes is not None]
+        return all(a < b for a, b in zip(present, present[1:]))
@@ -1,6 +1,24 @@
 """Zone and city mapping utilities."""
 
-from config.settings import FILENAME_TO_CITY, TIMEZONE, COUNTRY
+import re
+from typing import Dict, List, Tuple
+
+from config.settings import FILENAME_TO_CITY, ZONE_DISTRICTS, TIMEZONE, COUNTRY
+
+# Every filename pattern compiled into one alternation, longest first
+_PATTERN_TO_CITY = {
+    pattern: city_id
+    for city_id, patterns in FILENAME_TO_CITY.items()
+    for pattern in patterns
+}
+_FILENAME_MATCHER = re.compile(
+    '|'.join(re.escape(p) for p in sorted(_PATTERN_TO_CITY, key=len, reverse=True))
+)
+
+
+def district_id(name: str) -> str:
+    """Convert a district name such as 'Nuwara Eliya' to an ID ('nuwara_eliya')."""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
 
 
 class ZoneMapper:
@@ -10,6 +28,8 @@ class ZoneMapper:
         self.zone_mapping = {}
         self.zone_to_filename = {}
         self.cities_data = []
+        self._city_ids = set()
+        self._filename_cache = {}
     
     def identify_city_from_filename(self, filename: str) -> str:
         """
@@ -21,12 +41,10 @@ class ZoneMapper:
         Returns:
             City ID or None
         """
-        filename_upper = filename.upper()
-        for city_id, patterns in FILENAME_TO_CITY.items():
-            for pattern in patterns:
-                if pattern in filename_upper:
-                    return city_id
-        return None
+        if filename not in self._filename_cache:
+            match = _FILENAME_MATCHER.search(filename.upper())
+            self._filename_cache[filename] = _PATTERN_TO_CITY[match.group(0)] if match else None
+        return self._filename_cache[filename]
     
     def build_zone_mapping(self, zone: str, filename: str) -> str:
         """
@@ -51,7 +69,8 @@ class ZoneMapper:
             self.zone_to_filename[zone] = filename
             
             # Add to cities_data if not already present
-            if not any(city['id'] == city_id for city in self.cities_data):
+            if city_id not in self._city_ids:
+                self._city_ids.add(city_id)
                 self.cities_data.append(city_info)
             
             return city_id
@@ -59,4 +78,35 @@ class ZoneMapper:
     
     def get_city_info(self, zone: str) -> dict:
         """Get city information for a zone."""
-        return self.zone_mapping.get(zone)
\ No newline at end of file
+        return self.zone_mapping.get(zone)
+    
+    def expand_districts(self, prayer_times: Dict[str, Dict]) -> Tuple[List[dict], Dict[str, Dict]]:
+        """
+        Fan each zone city out to every district it covers.
+        
+        Districts of one zone share the zone's time table by reference;
+        nothing is copied.
+        
+        Args:
+            prayer_times: Dictionary of prayer times by zone city
+            
+        Returns:
+            Tuple of (district cities metadata, prayer times by district ID)
+        """
+        district_cities = []
+        district_times = {}
+        for city in self.cities_data:
+            zone_city_id = city['id']
+            if zone_city_id not in prayer_times:
+                continue
+            for name in ZONE_DISTRICTS.get(zone_city_id, [city['name']]):
+                did = district_id(name)
+                district_cities.append({
+                    'id': did,
+                    'name': name,
+                    'country': COUNTRY,
+                    'timezone': TIMEZONE,
+                    'zone': zone_city_id
+                })
+                district_times[did] = prayer_times[zone_city_id]
+        return district_cities, district_times
@@ -6,45 +6,76 @@ import time
 import random
 from typing import List, Optional
 
+from config.settings import REQUEST_TIMEOUT
+
 
 class PDFDownloader:
     """Download PDF files from URLs."""
     
-    def __init__(self, download_dir="data/prayer_times", max_retries=3, backoff_factor=2):
+    def __init__(self, download_dir="data/prayer_times", max_retries=3, backoff_factor=2, request_delay=(0.5, 1.5)):
         # Set timezone for the entire process
         os.environ['TZ'] = 'Asia/Colombo'
         
         self.download_dir = download_dir
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.request_delay = request_delay
         os.makedirs(download_dir, exist_ok=True)
     
-    def download_pdfs(self, scraped_data: List[dict], months: Optional[List[str]] = None) -> List[str]:
+    def download_pdfs(self, scraped_data: List[dict], months: Optional[List[str]] = None,
+                      journal=None) -> List[str]:
         """
         Download all PDF files from scraped prayer time links.
         
         Args:
             scraped_data: List of dictionaries containing section and items
             month: Optional month string (e.g., 'January')
-            
+            journal: Optional RunJournal; links it already holds are reused
+                and every new download is recorded as soon as it finishes
+                
         Returns:
             List of downloaded file paths
         """
-        downloaded_files = []
         months_lower = [m.lower() for m in months] if months else None
-
-        for section in scraped_data:
-            for item in section["items"]:
-                item_month = item.get("month", "").lower()
-                if months_lower and item_month not in months_lower:
-                    continue
-
-                filepath = self._download_single_pdf(item)
+        items = [
+            item
+            for section in scraped_data
+            for item in section["items"]
+            if not months_lower or item.get("month", "").lower() in months_lower
+        ]
+        return self.download_items(items, journal=journal)
+    
+    def download_items(self, items: List[dict], journal=None) -> List[str]:
+        """
+        Download the PDFs of already selected month items.
+        
+        Args:
+            items: List of dictionaries with 'link' keys (e.g. from
+                LinkManifest.select)
+            journal: Optional RunJournal; links it already holds are reused
+                and every new download is recorded as soon as it finishes
+                
+        Returns:
+            List of downloaded file paths
+        """
+        downloaded_files = []
+        
+        for item in items:
+            if journal:
+                filepath = journal.get_download(item.get("link"))
                 if filepath:
                     downloaded_files.append(filepath)
-
-                time.sleep(random.uniform(0.5, 1.5))
-
+                    continue
+            
+            filepath = self._download_single_pdf(item)
+            if filepath:
+                downloaded_files.append(filepath)
+                if journal:
+                    journal.record_download(item["link"], filepath)
+            
+            if self.request_delay:
+                time.sleep(random.uniform(*self.request_delay))
+        
         return downloaded_files
     
     def _download_single_pdf(self, item: dict) -> str:
@@ -67,7 +98,7 @@ class PDFDownloader:
         for attempt in range(1, self.max_retries + 1):
             try:
                 print(f"⬇️ Downloading {filename} ...")
-                response = requests.get(link)
+                response = requests.get(link, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 
                 with open(filepath, "wb") as f:
@@ -1,6 +1,7 @@
 """Web scraper for ACJU prayer times website."""
 
 import requests
+import hashlib
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 from datetime import datetime
@@ -14,31 +15,39 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from config.settings import BASE_URL, REQUEST_TIMEOUT
+from config.settings import BASE_URL, REQUEST_TIMEOUT, ROBOTS_TTL
 from src.utils.date_utils import parse_hijri_day
 
 
 class ACJUWebScraper:
     """Scraper for ACJU prayer times PDF links."""
     
-    def __init__(self, base_url=BASE_URL, user_agent="ACJU-Scraper/1.0"):
+    def __init__(self, base_url=BASE_URL, user_agent="ACJU-Scraper/1.0", request_delay=(0.5, 1.5)):
         # Set timezone for the entire process
         os.environ['TZ'] = 'Asia/Colombo'
-
+        
+        self.base_url = base_url
         self.prayer_base_url = base_url + "prayer-times/"
         self.calendar_url = base_url + "calenders-en/"
         self.user_agent = user_agent
+        self.request_delay = request_delay
         self.headers = {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
         }
+        self._robots = None
+        self._robots_checked_at = 0
     
     def can_fetch(self, url):
-        rp = RobotFileParser()
-        rp.set_url(BASE_URL + "robots.txt")
-        rp.read()
-        return rp.can_fetch(self.user_agent, url)
+        # robots.txt is re-read at most once per ROBOTS_TTL
+        if self._robots is None or time.time() - self._robots_checked_at > ROBOTS_TTL:
+            rp = RobotFileParser()
+            rp.set_url(self.base_url + "robots.txt")
+            rp.read()
+            self._robots = rp
+            self._robots_checked_at = time.time()
+        return self._robots.can_fetch(self.user_agent, url)
     
     def get_districts(self):
         """
@@ -51,30 +60,81 @@ class ACJUWebScraper:
             print("❌ Crawling disallowed by robots.txt")
             return []
         
+        page = self.fetch_prayer_page()
+        if page is None:
+            return []
+        
+        return self.parse_districts(page["content"])
+    
+    def fetch_prayer_page(self, etag=None, last_modified=None):
+        """
+        Fetch the prayer times page, conditionally if validators are given.
+        
+        Args:
+            etag: ETag from a previous fetch
+            last_modified: Last-Modified header from a previous fetch
+            
+        Returns:
+            dict: 'not_modified', 'content', 'etag', 'last_modified' and
+            'sha256' of the content, or None on error
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
         try:
-            response = requests.get(self.prayer_base_url, headers=self.headers ,timeout=REQUEST_TIMEOUT)
+            response = requests.get(self.prayer_base_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                return {
+                    "not_modified": True,
+                    "content": None,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "sha256": None
+                }
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            details_elements = soup.select("div.e-n-accordion details")
-            
-            if not details_elements:
-                print("⚠️ No matching elements found.")
-                return []
-            
-            results = []
-            
-            for detail in tqdm(details_elements, desc="Extracting prayer time sections"):
-                section_data = self._extract_section_data(detail)
-                if section_data:
-                    results.append(section_data)
-                time.sleep(random.uniform(0.5, 1.5))
-                
-            return results
-            
+            return {
+                "not_modified": False,
+                "content": response.content,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha256": hashlib.sha256(response.content).hexdigest()
+            }
+        
         except requests.exceptions.RequestException as e:
             print(f"❌ Error fetching data: {e}")
+            return None
+    
+    def parse_districts(self, content):
+        """
+        Parse the district sections out of the prayer times page.
+        
+        Args:
+            content: Raw HTML of the prayer times page
+            
+        Returns:
+            list: List of dictionaries containing section and items data
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        details_elements = soup.select("div.e-n-accordion details")
+        
+        if not details_elements:
+            print("⚠️ No matching elements found.")
             return []
+        
+        results = []
+        
+        for detail in tqdm(details_elements, desc="Extracting prayer time sections"):
+            section_data = self._extract_section_data(detail)
+            if section_data:
+                results.append(section_data)
+            if self.request_delay:
+                time.sleep(random.uniform(*self.request_delay))
+        
+        return results
     
     def get_acju_calendar(self):
         """
@@ -0,0 +1,6 @@
+"""Long-running service modules."""
+
+from .daemon import RefreshDaemon
+from .api import fetch_districts, download_all, extract_all, build_dataset
+
+__all__ = ['RefreshDaemon', 'fetch_districts', 'download_all', 'extract_all', 'build_dataset']
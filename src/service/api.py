@@ -0,0 +1,204 @@
+"""Async library API for embedding the pipeline in asyncio services.
+
+Blocking work (HTTP requests, pdfplumber parsing) runs on an executor, so
+a refresh can run alongside request handling on the same event loop:
+
+    from src.service.api import fetch_districts, extract_all, build_dataset
+    
+    sections = await fetch_districts()
+    async for record in extract_all(paths):
+        ...
+    dataset = await build_dataset(months=["January"])
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.scraper.web_scraper import ACJUWebScraper
+from src.scraper.pdf_downloader import PDFDownloader
+from src.extractor.time_extractor import PrayerTimesExtractor
+from src.storage.manifest import LinkManifest
+from src.utils.file_utils import generate_output_json
+from src.utils.text_utils import normalize_month
+
+
+def _extract_one(filepath: str, low_memory: bool) -> Dict:
+    """Extract one PDF with its own extractor (safe to run on any worker)."""
+    filename = os.path.basename(filepath)
+    extractor = PrayerTimesExtractor(low_memory=low_memory)
+    zone, month, records = extractor.extract_from_pdf(filepath, filename)
+    if not zone or not month:
+        return {'filename': filename, 'zone': None, 'city': None, 'month': None,
+                'year': None, 'records': 0, 'times': {}, 'validation': None}
+    
+    city_id = extractor.zone_mapper.get_city_info(zone)['id']
+    return {
+        'filename': filename,
+        'zone': zone,
+        'city': city_id,
+        'month': month,
+        'year': extractor.get_block_years().get((city_id, month)),
+        'records': records,
+        'times': extractor.get_month_block(zone, month),
+        'validation': extractor.validation_reports.get((city_id, month))
+    }
+
+
+def _refresh_manifest(manifest_path: str, scraper: ACJUWebScraper) -> List[dict]:
+    """Load and refresh a LinkManifest (module level, so process pools can run it)."""
+    manifest = LinkManifest(manifest_path).load()
+    return manifest.sections() if manifest.refresh(scraper) else []
+
+
+async def fetch_districts(scraper: Optional[ACJUWebScraper] = None, manifest_path: Optional[str] = None,
+                          executor: Optional[Executor] = None) -> List[dict]:
+    """
+    Fetch the district/month PDF link list.
+    
+    Args:
+        scraper: Scraper to use (a default ACJUWebScraper if None)
+        manifest_path: Optional LinkManifest file; a fresh manifest is
+            used without contacting the site
+        executor: Executor for the blocking request (the loop's default if None)
+        
+    Returns:
+        List of dictionaries containing section and items
+    """
+    scraper = scraper or ACJUWebScraper()
+    loop = asyncio.get_running_loop()
+    
+    if not manifest_path:
+        return await loop.run_in_executor(executor, scraper.get_districts)
+    
+    return await loop.run_in_executor(executor, _refresh_manifest, manifest_path, scraper)
+
+
+async def download_all(sections: List[dict], download_dir: str, months: Optional[List[str]] = None,
+                       downloader: Optional[PDFDownloader] = None, max_concurrency: int = 4,
+                       executor: Optional[Executor] = None) -> List[str]:
+    """
+    Download the PDFs of the scraped sections concurrently.
+    
+    Args:
+        sections: List of dictionaries containing section and items
+        download_dir: Directory for the downloaded PDFs
+        months: Optional month names to restrict the download to
+        downloader: Downloader to use (a default PDFDownloader if None)
+        max_concurrency: Maximum downloads in flight
+        executor: Executor for the blocking requests (the loop's default if None)
+        
+    Returns:
+        List of downloaded file paths, in link order
+    """
+    downloader = downloader or PDFDownloader(download_dir)
+    months_lower = {(normalize_month(m) or m).lower() for m in months} if months else None
+    items = [
+        item
+        for section in sections
+        for item in section['items']
+        if not months_lower or item.get('month', '').lower() in months_lower
+    ]
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def download(item):
+        async with semaphore:
+            return await loop.run_in_executor(executor, downloader.download_items, [item])
+    
+    results = await asyncio.gather(*(download(item) for item in items))
+    return [filepath for files in results for filepath in files]
+
+
+async def extract_all(pdf_paths: List[str], max_concurrency: int = 1, low_memory: bool = False,
+                      executor: Optional[Executor] = None) -> AsyncIterator[Dict]:
+    """
+    Extract prayer times from PDFs, yielding one record per PDF as it finishes.
+    
+    Every PDF is parsed by its own PrayerTimesExtractor on the executor.
+    
+    Args:
+        pdf_paths: Paths to the PDF files
+        max_concurrency: Maximum PDFs parsed at the same time
+        low_memory: Use the extractor's bounded-memory mode
+        executor: Executor for the pdfplumber work (the loop's default if None)
+        
+    Yields:
+        Dictionary with 'filename', 'zone', 'city', 'month', 'year',
+        'records', 'times' and the BlockValidator report as 'validation'
+        (None zone if the PDF was skipped)
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def extract(filepath):
+        async with semaphore:
+            return await loop.run_in_executor(executor, _extract_one, filepath, low_memory)
+    
+    tasks = [asyncio.ensure_future(extract(filepath)) for filepath in pdf_paths]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def build_dataset(months: Optional[List[str]] = None, scraper: Optional[ACJUWebScraper] = None,
+                        cities: str = "zones", previous: Optional[Dict] = None,
+                        manifest_path: Optional[str] = None, download_concurrency: int = 4,
+                        extract_concurrency: int = 1, low_memory: bool = False,
+                        executor: Optional[Executor] = None) -> Optional[Dict]:
+    """
+    Scrape, download and extract prayer times into a dataset.
+    
+    Nothing is written to the output directory; PDFs go to a temporary
+    directory that is removed afterwards.
+    
+    Args:
+        months: Optional month names (e.g. 'January', 'feb'); all if None
+        scraper: Scraper to use (a default ACJUWebScraper if None)
+        cities: 'zones' or 'districts' (see generate_output_json)
+        previous: Previously published dataset, to keep 'last_updated'
+            stable when nothing changed
+        manifest_path: Optional LinkManifest file for the link list
+        download_concurrency: Maximum downloads in flight
+        extract_concurrency: Maximum PDFs parsed at the same time
+        low_memory: Use the extractor's bounded-memory mode
+        executor: Executor for the blocking work (the loop's default if None)
+        
+    Returns:
+        Dataset as produced by generate_output_json, or None if nothing was found
+    """
+    sections = await fetch_districts(scraper, manifest_path=manifest_path, executor=executor)
+    if not sections:
+        return None
+    
+    extractor = PrayerTimesExtractor()
+    with tempfile.TemporaryDirectory(prefix="prayer_times_") as download_dir:
+        pdf_paths = await download_all(sections, download_dir, months=months,
+                                       max_concurrency=download_concurrency, executor=executor)
+        if not pdf_paths:
+            return None
+        
+        async for record in extract_all(pdf_paths, max_concurrency=extract_concurrency,
+                                        low_memory=low_memory, executor=executor):
+            if record['zone']:
+                extractor.restore_block(record['filename'], record['zone'], record['month'],
+                                        record['year'], record['times'])
+    
+    extractor.enhance_asr_times()
+    
+    district_cities = None
+    if cities == "districts":
+        district_cities, _ = extractor.zone_mapper.expand_districts(extractor.get_prayer_times())
+    
+    return generate_output_json(
+        extractor.get_cities_data(),
+        extractor.get_prayer_times(),
+        district_cities=district_cities,
+        previous=previous
+    )
@@ -0,0 +1,244 @@
+"""Long-running refresh daemon with change-driven rebuilds."""
+
+import json
+import os
+import random
+import socket
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import (
+    OUTPUT_DIR, OUTPUT_FILENAME, PATCH_DIR, PATCH_HISTORY,
+    PRECOMPRESS_FORMATS, DAEMON_INTERVAL, DAEMON_JITTER, DAEMON_STATE_FILENAME, MANIFEST_FILENAME
+)
+from src.scraper.web_scraper import ACJUWebScraper
+from src.scraper.pdf_downloader import PDFDownloader
+from src.extractor.time_extractor import PrayerTimesExtractor
+from src.extractor.zone_mapper import ZoneMapper
+from src.storage.manifest import LinkManifest
+from src.storage.patches import PatchChain
+from src.utils.json_index import save_index
+from src.utils.file_utils import (
+    generate_output_json, save_json, load_json, write_atomic, canonical_json_bytes
+)
+
+
+class RefreshDaemon:
+    """
+    Re-scrape the district link list on a schedule and rebuild on change.
+    
+    The link list lives in the shared LinkManifest, which is revalidated
+    with one conditional GET per cycle: a 304 (or an identical page hash)
+    means nothing is parsed. Only PDF links that the published dataset was
+    not built from are downloaded and extracted; their (city, month) blocks replace the
+    ones in the published dataset, which is then rewritten atomically and
+    announced to the configured notifiers.
+    """
+    
+    def __init__(self, scraper: ACJUWebScraper = None, output_dir: str = OUTPUT_DIR,
+                 interval: float = DAEMON_INTERVAL, jitter: float = DAEMON_JITTER,
+                 notify_file: Optional[str] = None, notify_socket: Optional[str] = None,
+                 callbacks: Optional[List[Callable[[Dict], None]]] = None,
+                 compress=PRECOMPRESS_FORMATS):
+        self.scraper = scraper or ACJUWebScraper()
+        self.output_path = os.path.join(output_dir, OUTPUT_FILENAME)
+        self.state_path = os.path.join(output_dir, DAEMON_STATE_FILENAME)
+        self.manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+        # The version chain belongs next to the dataset it describes
+        self.patch_dir = os.path.join(output_dir, os.path.relpath(PATCH_DIR, OUTPUT_DIR))
+        self.interval = interval
+        self.jitter = jitter
+        self.notify_file = notify_file
+        self.notify_socket = notify_socket
+        self.callbacks = list(callbacks or [])
+        self.compress = compress
+        os.makedirs(output_dir, exist_ok=True)
+    
+    def run_forever(self):
+        """Run refresh cycles until interrupted."""
+        print(f"🔁 Refresh daemon started (every {self.interval:.0f}s ± {self.jitter:.0f}s)")
+        try:
+            while True:
+                try:
+                    self.run_cycle()
+                except Exception as e:
+                    print(f"❌ Refresh cycle failed: {e}")
+                delay = max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+                time.sleep(delay)
+        except KeyboardInterrupt:
+            print("👋 Refresh daemon stopped")
+    
+    def run_cycle(self) -> bool:
+        """
+        Run one refresh cycle.
+        
+        Returns:
+            True if the dataset was rebuilt
+        """
+        state = self._load_state()
+        
+        # The shared link manifest does the conditional GET, so main runs
+        # within MANIFEST_TTL see the links this cycle found
+        manifest = LinkManifest(self.manifest_path).load()
+        if not manifest.refresh(self.scraper, force=True):
+            return False
+        
+        # Diff the link list against the links the published dataset was built from
+        published = load_json(self.output_path)
+        known_links = state.get('links', {}) if published else {}
+        current_links = {item['link']: item for item in manifest.items}
+        added = [link for link in current_links if link not in known_links]
+        removed = [link for link in known_links if link not in current_links]
+        
+        if not added and not removed:
+            print("💤 No PDF links changed")
+            return False
+        
+        print(f"🆕 {len(added)} new PDF link(s), {len(removed)} removed")
+        extracted, new_cities = self._extract_links(added, current_links)
+        
+        # Blocks of removed links go away unless a new link replaced them
+        replaced = {(info['city'], info['month_num']) for info in extracted.values() if info.get('city')}
+        dropped = {
+            (known_links[link]['city'], known_links[link]['month_num'])
+            for link in removed if known_links[link].get('city')
+        } - replaced
+        
+        dataset = self._rebuild(published, extracted, new_cities, dropped)
+        self._publish(dataset, published)
+        
+        # Links that failed to download stay unknown so the next cycle retries them
+        failed = [link for link in added if link not in extracted]
+        if failed:
+            print(f"⚠️ {len(failed)} PDF(s) failed; they will be retried next cycle")
+        
+        state['links'] = {}
+        for link in current_links:
+            if link in failed:
+                continue
+            source = extracted[link] if link in extracted else known_links.get(link, {})
+            state['links'][link] = {'city': source.get('city'), 'month_num': source.get('month_num')}
+        self._save_state(state)
+        
+        self._notify({
+            'event': 'updated',
+            'path': self.output_path,
+            'content_hash': dataset['content_hash'],
+            'dataset_version': dataset.get('dataset_version'),
+            'changed_blocks': sorted(f"{city}:{month}" for city, month in replaced | dropped),
+            'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        })
+        return True
+    
+    def _extract_links(self, links: List[str], current_links: Dict[str, Dict]) -> Tuple[Dict[str, Dict], List[dict]]:
+        """Download and extract the given links with a fresh extractor."""
+        if not links:
+            return {}, []
+        
+        extractor = PrayerTimesExtractor()
+        extracted = {}
+        # A private download directory, so a concurrent main run keeps its PDFs
+        with tempfile.TemporaryDirectory(prefix="prayer_times_") as download_dir:
+            downloader = PDFDownloader(download_dir)
+            try:
+                for link in links:
+                    items = [{'month': current_links[link]['month'], 'link': link}]
+                    files = downloader.download_pdfs([{'section': current_links[link]['section'], 'items': items}])
+                    if not files:
+                        continue
+                    filepath = files[0]
+                    zone, month, records = extractor.extract_from_pdf(filepath, os.path.basename(filepath))
+                    if not zone or not month:
+                        extracted[link] = {}
+                        continue
+                    city_id = extractor.zone_mapper.get_city_info(zone)['id']
+                    extracted[link] = {
+                        'city': city_id,
+                        'month_num': month,
+                        'zone': zone,
+                        'records': records,
+                        'times': extractor.get_month_block(zone, month)
+                    }
+            finally:
+                extractor.close()
+        
+        # Blocks hold references into the extractor, so this converts them too
+        extractor.enhance_asr_times()
+        
+        return extracted, extractor.get_cities_data()
+    
+    def _rebuild(self, published: Optional[Dict], extracted: Dict[str, Dict],
+                 new_cities: List[dict], dropped: set) -> Dict:
+        """Replace changed (city, month) blocks in the published dataset."""
+        prayer_times = defaultdict(dict)
+        cities = {}
+        if published:
+            for city_id, block in published.get('prayer_times', {}).items():
+                prayer_times[city_id] = dict(block.get('times', {}))
+            cities = {city['id']: city for city in published.get('cities', [])}
+        
+        for city_id, month in dropped:
+            prayer_times[city_id] = {
+                date: data for date, data in prayer_times[city_id].items() if not date.startswith(f"{month}-")
+            }
+        
+        for info in extracted.values():
+            if not info.get('city'):
+                continue
+            city_times = prayer_times[info['city']]
+            for date in [d for d in city_times if d.startswith(f"{info['month_num']}-")]:
+                del city_times[date]
+            city_times.update(info['times'])
+        
+        prayer_times = {city_id: times for city_id, times in prayer_times.items() if times}
+        
+        # A dataset published with --cities districts lists districts that
+        # name their zone; new zones are fanned out the same way
+        if any('zone' in city for city in cities.values()):
+            covered = {city['zone'] for city in cities.values() if 'zone' in city}
+            mapper = ZoneMapper()
+            mapper.cities_data = [city for city in new_cities if city['id'] not in covered]
+            new_cities, _ = mapper.expand_districts(prayer_times)
+        cities.update({city['id']: city for city in new_cities})
+        cities = [city for city in cities.values() if city.get('zone', city['id']) in prayer_times]
+        return generate_output_json(cities, prayer_times, previous=published)
+    
+    def _publish(self, dataset: Dict, published: Optional[Dict]):
+        """Record the new version and rewrite the output atomically."""
+        patch_chain = PatchChain(self.patch_dir, max_versions=PATCH_HISTORY)
+        dataset['dataset_version'] = patch_chain.record(published, dataset)
+        if save_json(dataset, self.output_path, compress=self.compress):
+            save_index(dataset, self.output_path)
+    
+    def _notify(self, event: Dict):
+        """Announce a rebuild to the file, socket and callback hooks."""
+        payload = canonical_json_bytes(event)
+        
+        if self.notify_file:
+            write_atomic(self.notify_file, payload + b'\n')
+        
+        if self.notify_socket:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(5)
+                    sock.connect(self.notify_socket)
+                    sock.sendall(payload + b'\n')
+            except OSError as e:
+                print(f"⚠️ Could not notify {self.notify_socket}: {e}")
+        
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"⚠️ Notification hook failed: {e}")
+        
+        print(f"📣 Published dataset v{event['dataset_version']}")
+    
+    def _load_state(self) -> Dict:
+        return load_json(self.state_path) or {}
+    
+    def _save_state(self, state: Dict):
+        write_atomic(self.state_path, json.dumps(state, ensure_ascii=False, sort_keys=True).encode('utf-8'))
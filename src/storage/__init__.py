@@ -0,0 +1,9 @@
+"""Persistent storage modules."""
+
+from .archive import ArchiveStore
+from .patches import PatchChain, diff_datasets, apply_patch
+from .journal import RunJournal
+from .sqlite_store import SQLiteStore
+from .manifest import LinkManifest
+
+__all__ = ['ArchiveStore', 'PatchChain', 'diff_datasets', 'apply_patch', 'RunJournal', 'SQLiteStore', 'LinkManifest']
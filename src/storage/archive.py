@@ -0,0 +1,181 @@
+"""Multi-year archive of extracted prayer times."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from config.settings import VERSION
+from src.utils.file_utils import canonical_json_bytes, write_atomic
+
+ARCHIVE_VERSION = VERSION
+
+
+class ArchiveStore:
+    """
+    Keep many years of prayer times per zone.
+    
+    The earliest year of a zone is stored in full. Every later year only
+    stores the prayers that differ from the year before it, plus the days
+    it no longer has (e.g. 29 February). ACJU tables barely change from
+    one year to the next, so each extra year costs a handful of entries.
+    
+    On disk::
+    
+        {"version": "1.0",
+         "zones": {"colombo": {
+             "2024": {"times": {"01-01": {...}, ...}},
+             "2025": {"base": "2024",
+                      "times": {"03-05": {"fajr": "4:59 AM"}},
+                      "removed": ["02-29"]}}}}
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.zones = {}
+        self._cache = {}
+    
+    def load(self) -> "ArchiveStore":
+        """
+        Load the archive from disk (an absent file is an empty archive).
+        
+        Returns:
+            The store itself
+        """
+        self.zones = {}
+        self._cache = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.zones = json.load(f).get('zones', {})
+        return self
+    
+    def save(self) -> bool:
+        """
+        Write the archive to disk atomically.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            write_atomic(self.path, canonical_json_bytes({'version': ARCHIVE_VERSION, 'zones': self.zones}))
+            print(f"✅ Archive saved to {self.path}")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving archive: {e}")
+            return False
+    
+    def years(self, zone: str) -> List[str]:
+        """Years stored for a zone, oldest first."""
+        return sorted(self.zones.get(zone, {}))
+    
+    def get_year(self, zone: str, year: str) -> Dict[str, Dict]:
+        """
+        Get the full time table of a zone for one year.
+        
+        Args:
+            zone: Zone city ID (e.g. 'colombo')
+            year: Four-digit year
+            
+        Returns:
+            Dictionary of 'MM-DD' date to prayer data (empty if unknown)
+        """
+        year = str(year)
+        if (zone, year) in self._cache:
+            return self._cache[(zone, year)]
+        
+        entry = self.zones.get(zone, {}).get(year)
+        if entry is None:
+            return {}
+        
+        base = self.get_year(zone, entry['base']) if 'base' in entry else {}
+        removed = set(entry.get('removed', []))
+        times = {date: data for date, data in base.items() if date not in removed}
+        for date, changes in entry['times'].items():
+            times[date] = {**times.get(date, {}), **changes}
+        
+        self._cache[(zone, year)] = times
+        return times
+    
+    def get(self, zone: str, date: str) -> Optional[Dict]:
+        """
+        Look up one day.
+        
+        Args:
+            zone: Zone city ID (e.g. 'colombo')
+            date: Full date as 'YYYY-MM-DD'
+            
+        Returns:
+            Prayer data for the day or None
+        """
+        year, month_day = date[:4], date[5:]
+        return self.get_year(zone, year).get(month_day)
+    
+    def add_year(self, zone: str, year: str, times: Dict[str, Dict]):
+        """
+        Merge a (possibly partial) year of times into the archive.
+        
+        Days already archived for that year are kept unless `times`
+        replaces them, so single-month runs only touch their month.
+        
+        Args:
+            zone: Zone city ID (e.g. 'colombo')
+            year: Four-digit year
+            times: Dictionary of 'MM-DD' date to prayer data
+        """
+        year = str(year)
+        full_years = {y: dict(self.get_year(zone, y)) for y in self.years(zone)}
+        full_years.setdefault(year, {}).update(times)
+        self.zones[zone] = self._encode_chain(full_years)
+        self._cache = {key: value for key, value in self._cache.items() if key[0] != zone}
+    
+    def ingest(self, prayer_times: Dict[str, Dict], block_years: Dict[tuple, str]) -> int:
+        """
+        Add one extraction run to the archive.
+        
+        Args:
+            prayer_times: Dictionary of prayer times by city ('MM-DD' keys)
+            block_years: Year of each (city, month) block; blocks without
+                a year are skipped
+            
+        Returns:
+            Number of days ingested
+        """
+        count = 0
+        for city_id, city_times in prayer_times.items():
+            by_year = {}
+            undated = set()
+            for date, data in city_times.items():
+                year = block_years.get((city_id, date[:2]))
+                if year:
+                    by_year.setdefault(year, {})[date] = data
+                else:
+                    undated.add(date[:2])
+            for month in sorted(undated):
+                print(f"⚠️ Not archiving {city_id} month {month}: the PDF does not state its year")
+            for year, times in by_year.items():
+                self.add_year(city_id, year, times)
+                count += len(times)
+        return count
+    
+    @staticmethod
+    def _encode_chain(full_years: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict]:
+        """Delta-encode each year against the previous stored year."""
+        encoded = {}
+        previous_year, previous = None, None
+        for year in sorted(full_years):
+            times = full_years[year]
+            if previous is None:
+                encoded[year] = {'times': times}
+            else:
+                changes = {}
+                for date, data in times.items():
+                    old = previous.get(date, {})
+                    diff = {field: value for field, value in data.items() if old.get(field) != value}
+                    if diff:
+                        changes[date] = diff
+                entry = {'base': previous_year, 'times': changes}
+                removed = sorted(date for date in previous if date not in times)
+                if removed:
+                    entry['removed'] = removed
+                encoded[year] = entry
+            previous_year, previous = year, times
+        return encoded
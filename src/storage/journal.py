@@ -0,0 +1,158 @@
+"""Checkpoint journal for resumable runs."""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+
+def file_sha256(filepath: str) -> str:
+    """
+    Compute the SHA-256 of a file.
+    
+    Args:
+        filepath: Path to file
+        
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RunJournal:
+    """
+    Append-only record of the work a run has finished.
+    
+    Every event is one JSON line, flushed and fsynced as soon as it is
+    written, so a killed process loses at most the PDF it was working on:
+    
+        {"event": "scraped", "sections": [...]}
+        {"event": "downloaded", "link": ..., "path": ..., "sha256": ...}
+        {"event": "parsed", "filename": ..., "sha256": ..., "zone": ...,
+         "month": ..., "year": ..., "records": ..., "times": {...}}
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.scraped = None
+        self.downloaded = {}
+        self.parsed = {}
+    
+    def reset(self):
+        """Start a fresh journal, discarding any previous run."""
+        self.scraped = None
+        self.downloaded = {}
+        self.parsed = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def load(self) -> "RunJournal":
+        """
+        Replay the journal left by an interrupted run.
+        
+        A truncated last line (the process died mid-write) is ignored.
+        
+        Returns:
+            The journal itself
+        """
+        self.scraped = None
+        self.downloaded = {}
+        self.parsed = {}
+        if not os.path.exists(self.path):
+            return self
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(entry)
+        
+        print(f"📒 Journal: {len(self.downloaded)} downloaded, {len(self.parsed)} parsed")
+        return self
+    
+    def complete(self):
+        """Remove the journal once the run has finished successfully."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def record_scraped(self, sections: List[dict]):
+        """Record the scraped district/month link list."""
+        self._append({'event': 'scraped', 'sections': sections})
+    
+    def record_download(self, link: str, filepath: str):
+        """Record a finished PDF download."""
+        self._append({
+            'event': 'downloaded',
+            'link': link,
+            'path': filepath,
+            'sha256': file_sha256(filepath)
+        })
+    
+    def record_parse(self, filepath: str, zone: Optional[str], month: Optional[str],
+                     year: Optional[str], times: Dict[str, Dict]):
+        """Record the extraction result of one PDF (zone None if skipped)."""
+        self._append({
+            'event': 'parsed',
+            'filename': os.path.basename(filepath),
+            'sha256': file_sha256(filepath),
+            'zone': zone,
+            'month': month,
+            'year': year,
+            'records': len(times),
+            'times': times
+        })
+    
+    def get_download(self, link: str) -> Optional[str]:
+        """
+        Path of an already downloaded PDF, if it is still intact on disk.
+        
+        Args:
+            link: PDF URL
+            
+        Returns:
+            File path or None
+        """
+        entry = self.downloaded.get(link)
+        if entry and os.path.exists(entry['path']) and file_sha256(entry['path']) == entry['sha256']:
+            return entry['path']
+        return None
+    
+    def get_parse(self, filepath: str) -> Optional[Dict]:
+        """
+        Journaled extraction result for a PDF with unchanged content.
+        
+        Args:
+            filepath: Path to PDF file
+            
+        Returns:
+            Parsed entry or None
+        """
+        entry = self.parsed.get(os.path.basename(filepath))
+        if entry and entry['sha256'] == file_sha256(filepath):
+            return entry
+        return None
+    
+    def _apply(self, entry: Dict):
+        event = entry.get('event')
+        if event == 'scraped':
+            self.scraped = entry['sections']
+        elif event == 'downloaded':
+            self.downloaded[entry['link']] = entry
+        elif event == 'parsed':
+            self.parsed[entry['filename']] = entry
+    
+    def _append(self, entry: Dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(entry)
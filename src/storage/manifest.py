@@ -0,0 +1,185 @@
+"""Cached district/month PDF link manifest."""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from config.settings import MANIFEST_TTL
+from src.extractor.zone_mapper import ZoneMapper
+from src.utils.file_utils import load_json, write_atomic
+from src.utils.text_utils import normalize_month
+
+
+class LinkManifest:
+    """
+    Persisted list of (section, month, link) entries from the prayer times page.
+    
+    The manifest keeps the page's ETag, Last-Modified and hash. Within
+    `ttl` seconds of the last check it is used without touching the
+    site; after that a conditional GET decides whether the page has to be
+    parsed again. Entries are indexed by month name and zone city, so
+    selecting the links for a month or zone is a lookup:
+    
+        {"fetched_at": ..., "etag": ..., "last_modified": ..., "page_hash": ...,
+         "items": [{"section": ..., "month": ..., "link": ..., "city": ...}],
+         "by_month": {"january": [0, 12, ...]}, "by_zone": {"colombo": [0, 1, ...]}}
+    """
+    
+    def __init__(self, path: str, ttl: float = MANIFEST_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.fetched_at = 0
+        self.etag = None
+        self.last_modified = None
+        self.page_hash = None
+        self.items = []
+        self.by_month = {}
+        self.by_zone = {}
+    
+    def load(self) -> "LinkManifest":
+        """
+        Load the manifest from disk, if there is one.
+        
+        Returns:
+            The manifest itself
+        """
+        data = load_json(self.path)
+        if not data:
+            return self
+        
+        self.fetched_at = data.get('fetched_at', 0)
+        self.etag = data.get('etag')
+        self.last_modified = data.get('last_modified')
+        self.page_hash = data.get('page_hash')
+        self.items = data.get('items', [])
+        self.by_month = data.get('by_month', {})
+        self.by_zone = data.get('by_zone', {})
+        return self
+    
+    def save(self):
+        """Write the manifest atomically."""
+        data = {
+            'fetched_at': self.fetched_at,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'page_hash': self.page_hash,
+            'items': self.items,
+            'by_month': self.by_month,
+            'by_zone': self.by_zone
+        }
+        write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+    
+    def is_fresh(self) -> bool:
+        """Whether the manifest was checked against the site within the TTL."""
+        return bool(self.items) and time.time() - self.fetched_at < self.ttl
+    
+    def refresh(self, scraper, force: bool = False) -> bool:
+        """
+        Bring the manifest up to date with the prayer times page.
+        
+        A fresh manifest is used as is. Otherwise the page is fetched
+        conditionally and only parsed if it changed. If the site cannot
+        be reached, a stale manifest is kept.
+        
+        Args:
+            scraper: ACJUWebScraper used to fetch and parse the page
+            force: Check the site even if the manifest is fresh
+            
+        Returns:
+            True if the manifest holds any links
+        """
+        if self.is_fresh() and not force:
+            age = (time.time() - self.fetched_at) / 60
+            print(f"📋 Using cached link manifest ({len(self.items)} links, checked {age:.0f} min ago)")
+            return True
+        
+        if not scraper.can_fetch(scraper.prayer_base_url):
+            print("❌ Crawling disallowed by robots.txt")
+            return False
+        
+        # Without cached links there is nothing to revalidate against
+        if self.items:
+            page = scraper.fetch_prayer_page(self.etag, self.last_modified)
+        else:
+            page = scraper.fetch_prayer_page()
+        if page is None:
+            if self.items:
+                print("⚠️ Could not reach the prayer times page; using the stale link manifest")
+            return bool(self.items)
+        
+        if page['not_modified'] or (page['sha256'] == self.page_hash and self.items):
+            print("📋 Prayer times page unchanged; reusing the link manifest")
+        else:
+            sections = scraper.parse_districts(page['content'])
+            if not sections:
+                return bool(self.items)
+            self.set_sections(sections)
+            self.page_hash = page['sha256']
+            print(f"📋 Link manifest rebuilt ({len(self.items)} links)")
+        
+        self.etag = page['etag'] or self.etag
+        self.last_modified = page['last_modified'] or self.last_modified
+        self.fetched_at = time.time()
+        self.save()
+        return True
+    
+    def set_sections(self, sections: List[dict]):
+        """
+        Replace the entries with a scraped section list and re-index them.
+        
+        Args:
+            sections: List of dictionaries containing section and items
+        """
+        zone_mapper = ZoneMapper()
+        self.items = []
+        self.by_month = {}
+        self.by_zone = {}
+        for section in sections:
+            for item in section['items']:
+                filename = os.path.basename(item['link'].split('?')[0])
+                entry = {
+                    'section': section['section'],
+                    'month': item['month'],
+                    'link': item['link'],
+                    'city': zone_mapper.identify_city_from_filename(filename)
+                }
+                index = len(self.items)
+                self.items.append(entry)
+                self.by_month.setdefault(item['month'].lower(), []).append(index)
+                if entry['city']:
+                    self.by_zone.setdefault(entry['city'], []).append(index)
+    
+    def sections(self) -> List[dict]:
+        """
+        The entries in the scraped section format.
+        
+        Returns:
+            List of dictionaries containing section and items
+        """
+        sections = {}
+        for entry in self.items:
+            sections.setdefault(entry['section'], []).append({'month': entry['month'], 'link': entry['link']})
+        return [{'section': name, 'items': items} for name, items in sections.items()]
+    
+    def select(self, months: Optional[List[str]] = None, zones: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Look up the entries for some months and/or zones.
+        
+        Args:
+            months: Month names or abbreviations (e.g. 'January', 'feb'); all if None
+            zones: Zone city IDs (e.g. 'colombo'); all if None
+            
+        Returns:
+            Matching entries in page order
+        """
+        indices = None
+        if months:
+            names = {(normalize_month(m) or m).lower() for m in months}
+            indices = {i for name in names for i in self.by_month.get(name, [])}
+        if zones:
+            zone_indices = {i for zone in zones for i in self.by_zone.get(zone, [])}
+            indices = zone_indices if indices is None else indices & zone_indices
+        if indices is None:
+            return list(self.items)
+        return [self.items[i] for i in sorted(indices)]
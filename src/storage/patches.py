@@ -0,0 +1,208 @@
+"""Versioned patches between successive prayer times datasets."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from config.settings import TIMEZONE
+from src.utils.file_utils import compute_content_hash, canonical_json_bytes, write_atomic
+
+
+def diff_datasets(old: Dict, new: Dict) -> Dict:
+    """
+    Compute the changed (city, date, prayer) values between two datasets.
+    
+    Runs in a single pass over both datasets.
+    
+    Args:
+        old: Previous dataset (as produced by generate_output_json)
+        new: New dataset
+        
+    Returns:
+        Patch dictionary. Each change is [city, date, prayer, value];
+        a None value deletes the prayer, a None prayer deletes the date
+        and a None date deletes the city.
+    """
+    old_times = old.get('prayer_times', {})
+    new_times = new.get('prayer_times', {})
+    changes = []
+    
+    for city_id, city_block in new_times.items():
+        new_days = city_block.get('times', {})
+        old_days = old_times.get(city_id, {}).get('times', {})
+        for date, prayers in new_days.items():
+            old_prayers = old_days.get(date, {})
+            for prayer, value in prayers.items():
+                if old_prayers.get(prayer) != value:
+                    changes.append([city_id, date, prayer, value])
+            for prayer in old_prayers:
+                if prayer not in prayers:
+                    changes.append([city_id, date, prayer, None])
+        for date in old_days:
+            if date not in new_days:
+                changes.append([city_id, date, None, None])
+    
+    for city_id in old_times:
+        if city_id not in new_times:
+            changes.append([city_id, None, None, None])
+    
+    patch = {
+        'from_hash': compute_content_hash(old),
+        'to_hash': compute_content_hash(new),
+        'changes': changes
+    }
+    if old.get('cities') != new.get('cities'):
+        patch['cities'] = new.get('cities')
+    return patch
+
+
+def apply_patch(dataset: Dict, patch: Dict) -> Dict:
+    """
+    Apply a patch to a dataset in place.
+    
+    The dataset's 'content_hash' and 'dataset_version' move to the patch's
+    target, so a client can ask for the patches after its new version.
+    
+    Args:
+        dataset: Dataset at the patch's 'from' version
+        patch: Patch produced by diff_datasets
+        
+    Returns:
+        The updated dataset
+        
+    Raises:
+        ValueError: If the dataset is not at the patch's 'from' version
+    """
+    content_hash = dataset.get('content_hash') or compute_content_hash(dataset)
+    if content_hash != patch['from_hash']:
+        raise ValueError(f"Patch applies to {patch['from_hash'][:12]}, dataset is {content_hash[:12]}")
+    
+    if 'cities' in patch:
+        dataset['cities'] = patch['cities']
+    
+    prayer_times = dataset.setdefault('prayer_times', {})
+    
+    for city_id, date, prayer, value in patch['changes']:
+        if date is None:
+            prayer_times.pop(city_id, None)
+            continue
+        city_block = prayer_times.setdefault(city_id, {'timezone': TIMEZONE, 'times': {}})
+        days = city_block.setdefault('times', {})
+        if prayer is None:
+            days.pop(date, None)
+        elif value is None:
+            days.get(date, {}).pop(prayer, None)
+        else:
+            days.setdefault(date, {})[prayer] = value
+    
+    dataset['content_hash'] = patch['to_hash']
+    if 'to_version' in patch:
+        dataset['dataset_version'] = patch['to_version']
+    return dataset
+
+
+class PatchChain:
+    """
+    Directory of numbered patches plus an index describing the version chain.
+    
+    index.json::
+    
+        {"latest": 3,
+         "versions": [{"version": 1, "content_hash": "..."},
+                      {"version": 2, "content_hash": "...", "patch": "patch-000002.json"},
+                      ...]}
+                      
+    A client holding version N applies every patch with a higher version,
+    in order, to reach the latest dataset.
+    """
+    
+    INDEX_FILENAME = "index.json"
+    
+    def __init__(self, patch_dir: str, max_versions: int = 100):
+        self.patch_dir = patch_dir
+        self.max_versions = max_versions
+        self.index_path = os.path.join(patch_dir, self.INDEX_FILENAME)
+    
+    def load_index(self) -> Dict:
+        """Load the chain index (empty chain if none exists yet)."""
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'latest': 0, 'versions': []}
+    
+    def record(self, old: Optional[Dict], new: Dict) -> int:
+        """
+        Record a new dataset version, writing a patch from the previous one.
+        
+        Args:
+            old: Previous dataset or None on the first run
+            new: New dataset
+            
+        Returns:
+            Version number of the new dataset
+        """
+        os.makedirs(self.patch_dir, exist_ok=True)
+        index = self.load_index()
+        content_hash = compute_content_hash(new)
+        
+        versions = index['versions']
+        if versions and versions[-1]['content_hash'] == content_hash:
+            return index['latest']
+        
+        version = index['latest'] + 1
+        entry = {'version': version, 'content_hash': content_hash}
+        
+        if old is not None and versions and versions[-1]['content_hash'] == compute_content_hash(old):
+            patch = diff_datasets(old, new)
+            patch['from_version'] = index['latest']
+            patch['to_version'] = version
+            patch_name = f"patch-{version:06d}.json"
+            self._write_json(os.path.join(self.patch_dir, patch_name), patch)
+            entry['patch'] = patch_name
+            print(f"🩹 Patch v{index['latest']} → v{version}: {len(patch['changes'])} changes")
+        else:
+            # No known predecessor: clients must start from the full dataset
+            print(f"🩹 Starting new patch chain at v{version}")
+        
+        versions.append(entry)
+        self._prune(versions)
+        index['latest'] = version
+        self._write_json(self.index_path, index)
+        return version
+    
+    def patches_since(self, version: int) -> Optional[List[str]]:
+        """
+        Patch files needed to bring a client from `version` to the latest.
+        
+        Args:
+            version: Version the client currently holds
+            
+        Returns:
+            Ordered list of patch file paths, or None if the chain is
+            broken and a full download is required
+        """
+        index = self.load_index()
+        if version not in {entry['version'] for entry in index['versions']}:
+            return None
+        
+        paths = []
+        for entry in index['versions']:
+            if entry['version'] <= version:
+                continue
+            if 'patch' not in entry:
+                return None
+            paths.append(os.path.join(self.patch_dir, entry['patch']))
+        return paths
+    
+    def _prune(self, versions: List[Dict]):
+        """Drop the oldest versions and their patch files beyond max_versions."""
+        while len(versions) > self.max_versions:
+            dropped = versions.pop(0)
+            if 'patch' in dropped:
+                path = os.path.join(self.patch_dir, dropped['patch'])
+                if os.path.exists(path):
+                    os.remove(path)
+    
+    @staticmethod
+    def _write_json(path: str, data: Dict):
+        write_atomic(path, canonical_json_bytes(data))
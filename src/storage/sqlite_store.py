@@ -0,0 +1,197 @@
+"""Indexed SQLite output backend."""
+
+import hashlib
+import sqlite3
+from typing import Dict, List, Optional
+
+from config.settings import TIMEZONE, COUNTRY
+from src.utils.date_utils import time_to_minutes
+from src.utils.file_utils import canonical_json_bytes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS zones (
+    id          TEXT PRIMARY KEY,
+    zone_number TEXT
+);
+CREATE TABLE IF NOT EXISTS cities (
+    id       TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    country  TEXT NOT NULL,
+    timezone TEXT NOT NULL,
+    zone_id  TEXT NOT NULL REFERENCES zones (id)
+);
+CREATE TABLE IF NOT EXISTS daily_times (
+    zone_id    TEXT NOT NULL REFERENCES zones (id),
+    date       TEXT NOT NULL,
+    month      TEXT NOT NULL,
+    fajr       INTEGER,
+    sunrise    INTEGER,
+    luhar      INTEGER,
+    asr_shafi  INTEGER,
+    asr_hanafi INTEGER,
+    maghrib    INTEGER,
+    isha       INTEGER,
+    PRIMARY KEY (zone_id, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS partitions (
+    zone_id      TEXT NOT NULL,
+    month        TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (zone_id, month)
+);
+CREATE INDEX IF NOT EXISTS idx_cities_zone ON cities (zone_id);
+CREATE INDEX IF NOT EXISTS idx_daily_times_month ON daily_times (month, zone_id);
+CREATE VIEW IF NOT EXISTS city_times AS
+    SELECT c.id AS city_id, t.*
+    FROM cities c JOIN daily_times t ON t.zone_id = c.zone_id;
+"""
+
+TIME_COLUMNS = ['fajr', 'sunrise', 'luhar', 'asr_shafi', 'asr_hanafi', 'maghrib', 'isha']
+
+
+class SQLiteStore:
+    """
+    Write prayer times to a normalized, indexed SQLite database.
+    
+    Times are stored once per zone as minutes since midnight; cities
+    (or districts) reference their zone. Each (zone, month) partition
+    carries a content hash, so a save only rewrites the partitions
+    whose data changed.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+    
+    def connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if needed."""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(SCHEMA)
+        return conn
+    
+    def save(self, cities_data: List[dict], prayer_times: Dict[str, Dict],
+             zone_numbers: Optional[Dict[str, str]] = None, full_run: bool = False) -> bool:
+        """
+        Save cities and prayer times, updating only changed partitions.
+        
+        Args:
+            cities_data: List of city (or district) metadata; a city's
+                'zone' key names its time table, defaulting to its ID
+            prayer_times: Dictionary of prayer times by zone city
+            zone_numbers: Optional mapping of zone city ID to zone number
+            full_run: The data covers every month, so stored cities and
+                partitions it lacks are removed. Otherwise (e.g. a
+                --month run) they are kept.
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        zone_numbers = zone_numbers or {}
+        try:
+            conn = self.connect()
+            try:
+                with conn:
+                    written = self._write(conn, cities_data, prayer_times, zone_numbers, full_run)
+            finally:
+                conn.close()
+            print(f"✅ SQLite database saved to {self.db_path} ({written} partition(s) rewritten)")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving SQLite database: {e}")
+            return False
+    
+    def get_day(self, city_id: str, date: str) -> Optional[Dict[str, int]]:
+        """
+        Look up one day for a city using the (zone, date) index.
+        
+        Args:
+            city_id: City or district ID
+            date: Date as 'MM-DD'
+            
+        Returns:
+            Dictionary of prayer column to minutes since midnight, or None
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                f"SELECT {', '.join(TIME_COLUMNS)} FROM city_times WHERE city_id = ? AND date = ?",
+                (city_id, date)
+            ).fetchone()
+        finally:
+            conn.close()
+        return dict(zip(TIME_COLUMNS, row)) if row else None
+    
+    def _write(self, conn: sqlite3.Connection, cities_data: List[dict],
+               prayer_times: Dict[str, Dict], zone_numbers: Dict[str, str], full_run: bool) -> int:
+        conn.executemany(
+            "INSERT INTO zones (id, zone_number) VALUES (?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET zone_number = COALESCE(excluded.zone_number, zone_number)",
+            [(zone_id, zone_numbers.get(zone_id)) for zone_id in prayer_times]
+        )
+        
+        if full_run:
+            conn.execute("DELETE FROM cities")
+        conn.executemany(
+            "INSERT OR REPLACE INTO cities (id, name, country, timezone, zone_id) VALUES (?, ?, ?, ?, ?)",
+            [
+                (city['id'], city.get('name', city['id'].title()), city.get('country', COUNTRY),
+                 city.get('timezone', TIMEZONE), city.get('zone', city['id']))
+                for city in cities_data
+            ]
+        )
+        
+        stored = dict(
+            ((zone_id, month), content_hash)
+            for zone_id, month, content_hash in conn.execute("SELECT zone_id, month, content_hash FROM partitions")
+        )
+        
+        current = set()
+        written = 0
+        for zone_id, city_times in prayer_times.items():
+            for month, days in self._partitions(city_times).items():
+                current.add((zone_id, month))
+                content_hash = hashlib.sha256(canonical_json_bytes(days)).hexdigest()
+                if stored.get((zone_id, month)) == content_hash:
+                    continue
+                
+                conn.execute("DELETE FROM daily_times WHERE zone_id = ? AND month = ?", (zone_id, month))
+                conn.executemany(
+                    f"INSERT INTO daily_times (zone_id, date, month, {', '.join(TIME_COLUMNS)}) "
+                    f"VALUES (?, ?, ?, {', '.join('?' * len(TIME_COLUMNS))})",
+                    [(zone_id, date, month, *self._to_minutes(prayer_data)) for date, prayer_data in days.items()]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO partitions (zone_id, month, content_hash) VALUES (?, ?, ?)",
+                    (zone_id, month, content_hash)
+                )
+                written += 1
+        
+        # Partitions that no longer exist in the dataset; a partial run
+        # says nothing about the months it did not process
+        for zone_id, month in (set(stored) - current if full_run else ()):
+            conn.execute("DELETE FROM daily_times WHERE zone_id = ? AND month = ?", (zone_id, month))
+            conn.execute("DELETE FROM partitions WHERE zone_id = ? AND month = ?", (zone_id, month))
+            written += 1
+        
+        return written
+    
+    @staticmethod
+    def _partitions(city_times: Dict[str, Dict]) -> Dict[str, Dict[str, Dict]]:
+        """Group a city's days by month, in date order."""
+        partitions = {}
+        for date in sorted(city_times):
+            partitions.setdefault(date[:2], {})[date] = city_times[date]
+        return partitions
+    
+    @staticmethod
+    def _to_minutes(prayer_data: Dict) -> List[Optional[int]]:
+        asr = prayer_data.get('asr', '')
+        asr_shafi, asr_hanafi = (asr.get('shafi', ''), asr.get('hanafi', '')) if isinstance(asr, dict) else (asr, asr)
+        return [
+            time_to_minutes(prayer_data.get('fajr', ''), 'fajr'),
+            time_to_minutes(prayer_data.get('sunrise', ''), 'sunrise'),
+            time_to_minutes(prayer_data.get('luhar', ''), 'luhar'),
+            time_to_minutes(asr_shafi, 'asr'),
+            time_to_minutes(asr_hanafi, 'asr'),
+            time_to_minutes(prayer_data.get('maghrib', ''), 'maghrib'),
+            time_to_minutes(prayer_data.get('isha', ''), 'isha'),
+        ]
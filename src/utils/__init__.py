@@ -1,18 +1,38 @@
 """Utility modules."""
 
-from .file_utils import generate_output_json, save_json, cleanup_directory
-from .text_utils import extract_zone_from_text, extract_month_from_text, normalize_month, clean_time
-from .date_utils import parse_date, parse_hijri_day, natural_sort_key
+from .file_utils import (
+    generate_output_json, save_json, load_json, write_atomic, write_if_changed,
+    canonical_json_bytes, compute_content_hash, cleanup_directory
+)
+from .text_utils import extract_zone_from_text, extract_month_from_text, extract_year_from_text, normalize_month, clean_time
+from .date_utils import parse_date, parse_hijri_day, natural_sort_key, time_to_minutes, days_in_month
+from .memory_utils import current_rss_mb, total_rss_mb, MemoryGovernor, MemoryReport
+from .json_index import build_index, save_index, JSONSliceReader
 
 __all__ = [
     'generate_output_json',
     'save_json',
+    'load_json',
+    'write_atomic',
+    'write_if_changed',
+    'canonical_json_bytes',
+    'compute_content_hash',
     'cleanup_directory',
     'extract_zone_from_text',
     'extract_month_from_text',
+    'extract_year_from_text',
     'normalize_month',
     'clean_time',
     'parse_date',
     'parse_hijri_day',
-    'natural_sort_key'
+    'natural_sort_key',
+    'time_to_minutes',
+    'days_in_month',
+    'current_rss_mb',
+    'total_rss_mb',
+    'MemoryGovernor',
+    'MemoryReport',
+    'build_index',
+    'save_index',
+    'JSONSliceReader'
 ]
\ No newline at end of file
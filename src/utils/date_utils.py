@@ -1,6 +1,9 @@
 """Date parsing utilities."""
 
 import re
+import calendar
+from typing import Optional
+
 from config.settings import HIJRI_MONTHS
 
 
@@ -62,4 +65,58 @@ def natural_sort_key(s: str):
         List of strings and integers for natural sorting
     """
     return [int(text) if text.isdigit() else text.lower() 
-            for text in re.split(r'(\d+)', s)]
\ No newline at end of file
+            for text in re.split(r'(\d+)', s)]
+
+# Prayers whose times fall before noon when a PDF omits the AM/PM suffix
+MORNING_PRAYERS = ('fajr', 'sunrise')
+
+
+def time_to_minutes(time_str: str, prayer: str = None) -> Optional[int]:
+    """
+    Convert a prayer time string to minutes since midnight.
+    
+    Args:
+        time_str: Time string such as '5:15 AM', '5:15am' or '5:15'
+        prayer: Prayer name used to infer AM/PM when the suffix is missing
+        
+    Returns:
+        Minutes since midnight or None if the string cannot be parsed
+    """
+    if not time_str:
+        return None
+    
+    match = re.match(r'^\s*(\d{1,2})[:.](\d{2})\s*([APap])?\.?\s*[Mm]?\.?\s*$', str(time_str))
+    if not match:
+        return None
+    
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    
+    suffix = match.group(3).upper() if match.group(3) else None
+    if suffix is None and hour <= 12 and prayer:
+        # Bare 12-hour clock: morning prayers are AM, everything from Luhar on is PM
+        if prayer in MORNING_PRAYERS:
+            suffix = 'A'
+        elif not (prayer == 'luhar' and hour >= 11):
+            suffix = 'P'
+    
+    if suffix == 'A' and hour == 12:
+        hour = 0
+    elif suffix == 'P' and hour < 12:
+        hour += 12
+    
+    return hour * 60 + minute
+
+
+def days_in_month(month: str) -> int:
+    """
+    Number of days expected in a month's prayer table.
+    
+    Args:
+        month: Month number (01-12)
+        
+    Returns:
+        Day count (29 for February so leap-year tables are accepted)
+    """
+    return calendar.monthrange(2000, int(month))[1]
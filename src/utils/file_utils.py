@@ -1,64 +1,223 @@
 """File I/O utilities."""
 
+import os
+import gzip
 import json
+import hashlib
 import shutil
-from datetime import datetime
-from typing import Dict
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence
 
 from config.settings import VERSION, DATA_SOURCE, TIMEZONE
 
 
-def generate_output_json(cities_data: list, prayer_times: dict) -> dict:
+def generate_output_json(cities_data: list, prayer_times: dict, district_cities: list = None,
+                         previous: Optional[Dict] = None) -> dict:
     """
     Generate the complete JSON structure.
     
     Args:
         cities_data: List of city metadata
         prayer_times: Dictionary of prayer times by city
+        district_cities: Optional list of district metadata (see
+            ZoneMapper.expand_districts). When given, every district is
+            listed as a city and points at its zone's shared time table
+            through its 'zone' key instead of carrying a copy.
+        previous: Previously published dataset. Its 'last_updated' is kept
+            when the content hash has not changed.
         
     Returns:
         Complete structured data dictionary
     """
     prayer_times_structure = {}
     
-    for city_id, city_times in prayer_times.items():
+    for city_id in sorted(prayer_times):
         prayer_times_structure[city_id] = {
             'timezone': TIMEZONE,
-            'times': city_times
+            'times': dict(sorted(prayer_times[city_id].items()))
         }
     
+    cities = district_cities if district_cities is not None else cities_data
+    
     complete_data = {
         'version': VERSION,
-        'last_updated': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ'),
         'data_source': DATA_SOURCE,
-        'cities': cities_data,
+        'cities': sorted(cities, key=lambda city: city['id']),
         'prayer_times': prayer_times_structure
     }
     
+    content_hash = compute_content_hash(complete_data)
+    if previous and previous.get('content_hash') == content_hash:
+        last_updated = previous.get('last_updated')
+    else:
+        last_updated = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    complete_data['last_updated'] = last_updated
+    complete_data['content_hash'] = content_hash
+    
     return complete_data
 
 
-def save_json(data: Dict, filename: str) -> bool:
+# Fields that describe a dataset rather than belong to its content
+VOLATILE_FIELDS = ('last_updated', 'content_hash', 'dataset_version')
+
+
+def canonical_json_bytes(data) -> bytes:
     """
-    Save data to JSON file.
+    Serialize data canonically: sorted keys, no whitespace, UTF-8.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Encoded JSON document
+    """
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def compute_content_hash(data: Dict) -> str:
+    """
+    Compute a SHA-256 hash of a dataset's content.
+    
+    Volatile fields such as 'last_updated' are ignored, so two runs that
+    extract the same times hash the same.
+    
+    Args:
+        data: Dataset dictionary
+        
+    Returns:
+        Hex digest
+    """
+    content = {key: value for key, value in data.items() if key not in VOLATILE_FIELDS}
+    return hashlib.sha256(canonical_json_bytes(content)).hexdigest()
+
+
+def load_json(filename: str) -> Optional[Dict]:
+    """
+    Load data from a JSON file.
+    
+    Args:
+        filename: Input filename
+        
+    Returns:
+        Loaded dictionary or None if the file is missing or unreadable
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Could not read {filename}: {e}")
+        return None
+
+
+def save_json(data: Dict, filename: str, compress: Sequence[str] = ()) -> bool:
+    """
+    Save data to JSON file in canonical form.
+    
+    The file is replaced atomically and left untouched when its bytes
+    would not change, so unchanged data keeps the same file and mtime.
     
     Args:
         data: Dictionary to save
         filename: Output filename
+        compress: Precompressed siblings to write next to it ('gz', 'zst')
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✅ Data saved to {filename}")
+        payload = canonical_json_bytes(data)
+        changed = write_if_changed(filename, payload)
+        for fmt in compress:
+            _write_precompressed(filename, payload, fmt, changed)
+        print(f"✅ Data saved to {filename}" if changed else f"✅ {filename} is unchanged")
         return True
     except Exception as e:
         print(f"❌ Error saving: {e}")
         return False
 
 
+def _current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+def write_atomic(filename: str, payload: bytes):
+    """
+    Write bytes to a file through a temporary file and rename.
+    
+    The temporary file is unique, so concurrent writers (the daemon and a
+    cron run) never share it, and it is flushed to disk before the rename
+    so a crash cannot leave the target empty.
+    
+    Args:
+        filename: Target filename
+        payload: File contents
+    """
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename) or ".",
+                                        prefix=os.path.basename(filename) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; published files keep the usual mode
+        os.chmod(tmp_filename, 0o666 & ~_UMASK)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+def write_if_changed(filename: str, payload: bytes) -> bool:
+    """
+    Write bytes atomically unless the file already holds exactly these bytes.
+    
+    An unchanged file keeps its mtime.
+    
+    Args:
+        filename: Target filename
+        payload: File contents
+        
+    Returns:
+        True if the file was written
+    """
+    if os.path.exists(filename) and os.path.getsize(filename) == len(payload):
+        with open(filename, 'rb') as f:
+            if f.read() == payload:
+                return False
+    write_atomic(filename, payload)
+    return True
+
+
+def _write_precompressed(filename: str, payload: bytes, fmt: str, changed: bool):
+    """Write a deterministic '.gz' or '.zst' sibling of filename."""
+    target = f"{filename}.{fmt}"
+    if not changed and os.path.exists(target):
+        return
+    
+    if fmt == 'gz':
+        # mtime=0 keeps the gzip header, and so the bytes, stable across runs
+        write_atomic(target, gzip.compress(payload, compresslevel=9, mtime=0))
+    elif fmt == 'zst':
+        try:
+            import zstandard
+        except ImportError:
+            print("⚠️ zstandard is not installed; skipping .zst output")
+            return
+        write_atomic(target, zstandard.ZstdCompressor(level=19).compress(payload))
+    else:
+        raise ValueError(f"Unknown compression format: {fmt}")
+
+
 def cleanup_directory(directory: str):
     """
     Remove a directory and all its contents.
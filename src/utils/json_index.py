@@ -0,0 +1,200 @@
+"""Byte-offset index for partial reads of the canonical JSON output."""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.file_utils import canonical_json_bytes, write_if_changed
+
+INDEX_FORMAT = "byte-offsets/1"
+INDEX_SUFFIX = ".index.json"
+
+
+def _member_spans(obj: Dict, start: int) -> Dict[str, Tuple[int, int]]:
+    """
+    Byte spans of the member values of a canonically serialized object.
+    
+    Canonical output writes members in sorted key order as '"key":value'
+    separated by commas, so every span follows from the lengths of the
+    members before it.
+    
+    Args:
+        obj: Dictionary serialized with canonical_json_bytes
+        start: Offset of its opening brace in the document
+        
+    Returns:
+        Dictionary of key to (start, end) of its value
+    """
+    spans = {}
+    position = start + 1
+    for i, key in enumerate(sorted(obj)):
+        if i:
+            position += 1
+        position += len(canonical_json_bytes(key)) + 1
+        end = position + len(canonical_json_bytes(obj[key]))
+        spans[key] = (position, end)
+        position = end
+    return spans
+
+
+def build_index(data: Dict, payload: bytes) -> Dict:
+    """
+    Build the byte-offset index of a dataset written with canonical_json_bytes.
+    
+    Args:
+        data: Dataset as produced by generate_output_json
+        payload: Its canonical serialization (the file contents)
+        
+    Returns:
+        Index with the span of every top-level field, for every city the
+        span of its block and of each month's run of 'MM-DD' members, and
+        the zone of every listed city that names one
+    """
+    fields = _member_spans(data, 0)
+    cities = {}
+    
+    if 'prayer_times' in fields:
+        city_spans = _member_spans(data['prayer_times'], fields['prayer_times'][0])
+        for city_id, (block_start, block_end) in city_spans.items():
+            block = data['prayer_times'][city_id]
+            entry = {'block': [block_start, block_end], 'months': {}}
+            
+            times = block.get('times') if isinstance(block, dict) else None
+            if isinstance(times, dict):
+                times_start, _ = _member_spans(block, block_start)['times']
+                date_spans = _member_spans(times, times_start)
+                for date in sorted(times):
+                    month = date[:2]
+                    # A month range starts at its first key, not at its first value
+                    key_start = date_spans[date][0] - len(canonical_json_bytes(date)) - 1
+                    if month not in entry['months']:
+                        entry['months'][month] = [key_start, date_spans[date][1]]
+                    else:
+                        entry['months'][month][1] = date_spans[date][1]
+            cities[city_id] = entry
+    
+    # With --cities districts, listed districts share their zone's time table
+    zones = {city['id']: city['zone'] for city in data.get('cities', []) if city.get('zone')}
+    
+    return {
+        'format': INDEX_FORMAT,
+        'file_size': len(payload),
+        'content_hash': data.get('content_hash'),
+        'fields': {key: list(span) for key, span in fields.items()},
+        'cities': cities,
+        'zones': zones
+    }
+
+
+def save_index(data: Dict, filename: str) -> str:
+    """
+    Write the sidecar index of a JSON output file written by save_json.
+    
+    Like the output itself, the index is left untouched when unchanged.
+    
+    Args:
+        data: Dataset that was saved
+        filename: JSON output filename (the index goes next to it)
+        
+    Returns:
+        Index filename
+    """
+    index_filename = filename + INDEX_SUFFIX
+    index = build_index(data, canonical_json_bytes(data))
+    write_if_changed(index_filename, canonical_json_bytes(index))
+    return index_filename
+
+
+class JSONSliceReader:
+    """
+    Read single cities or months from the JSON output without parsing all of it.
+    
+        reader = JSONSliceReader("output/prayer_times_sri_lanka_full.json")
+        reader.get_city("colombo")         # {'timezone': ..., 'times': {...}}
+        reader.get_month("colombo", "01")  # {'01-01': {...}, ...}
+        
+    The index is checked against the file's size and content hash before
+    use; a stale index raises ValueError rather than returning wrong data.
+    """
+    
+    def __init__(self, filename: str, index_filename: Optional[str] = None):
+        self.filename = filename
+        self.index_filename = index_filename or filename + INDEX_SUFFIX
+        self._index = None
+    
+    @property
+    def index(self) -> Dict:
+        if self._index is None:
+            with open(self.index_filename, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+            self._check(self._index)
+        return self._index
+    
+    def cities(self) -> List[str]:
+        """IDs of the cities that have a time table, including districts that share one."""
+        return sorted(set(self.index['cities']) | set(self.index.get('zones', {})))
+    
+    def get_field(self, name: str):
+        """
+        Decode one top-level field, e.g. 'cities' or 'last_updated'.
+        
+        Returns:
+            The field's value, or None if the dataset has no such field
+        """
+        span = self.index['fields'].get(name)
+        return json.loads(self._read(span)) if span else None
+    
+    def get_city(self, city_id: str) -> Optional[Dict]:
+        """
+        Decode one city's block.
+        
+        Returns:
+            Dictionary with 'timezone' and 'times', or None if unknown
+        """
+        entry = self._city_entry(city_id)
+        return json.loads(self._read(entry['block'])) if entry else None
+    
+    def get_month(self, city_id: str, month: str) -> Optional[Dict[str, Dict]]:
+        """
+        Decode one month of a city's times.
+        
+        Args:
+            city_id: City ID
+            month: Month number ('01'-'12')
+            
+        Returns:
+            Dictionary of 'MM-DD' date to prayer data, or None if unknown
+        """
+        entry = self._city_entry(city_id)
+        span = entry['months'].get(month) if entry else None
+        return json.loads(b'{' + self._read(span) + b'}') if span else None
+    
+    def get_day(self, city_id: str, date: str) -> Optional[Dict]:
+        """
+        Decode one day ('MM-DD') of a city's times.
+        
+        Returns:
+            Prayer data, or None if unknown
+        """
+        month_times = self.get_month(city_id, date[:2])
+        return month_times.get(date) if month_times else None
+    
+    def _city_entry(self, city_id: str) -> Optional[Dict]:
+        """Index entry of a city's time table, resolving districts to their zone."""
+        zone = self.index.get('zones', {}).get(city_id, city_id)
+        return self.index['cities'].get(zone)
+    
+    def _read(self, span) -> bytes:
+        start, end = span
+        with open(self.filename, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start)
+    
+    def _check(self, index: Dict):
+        if index.get('format') != INDEX_FORMAT:
+            raise ValueError(f"Unsupported index format: {index.get('format')}")
+        if os.path.getsize(self.filename) != index['file_size']:
+            raise ValueError(f"Index {self.index_filename} is stale (file size differs)")
+        span = index['fields'].get('content_hash')
+        if span and json.loads(self._read(span)) != index['content_hash']:
+            raise ValueError(f"Index {self.index_filename} is stale (content hash differs)")
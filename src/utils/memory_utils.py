@@ -0,0 +1,171 @@
+"""Memory measurement and throttling utilities."""
+
+import gc
+import os
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+
+def _statm_rss_mb(pid) -> Optional[float]:
+    """RSS of one process from /proc/<pid>/statm, or None where unavailable."""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    Resident set size of this process in MB.
+    
+    Returns:
+        RSS in MB, or None where it cannot be read
+    """
+    rss = _statm_rss_mb('self')
+    if rss is not None:
+        return rss
+    try:
+        import resource
+        # Peak rather than current RSS, but the best portable fallback (KB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def child_pids() -> List[int]:
+    """PIDs of this process's children (e.g. page workers), where /proc lists them."""
+    pids = []
+    try:
+        for task in os.listdir('/proc/self/task'):
+            with open(f'/proc/self/task/{task}/children') as f:
+                pids.extend(int(pid) for pid in f.read().split())
+    except (OSError, ValueError):
+        pass
+    return pids
+
+
+def total_rss_mb() -> Optional[float]:
+    """
+    Resident set size of this process plus its children in MB.
+    
+    Returns:
+        RSS in MB, or None where it cannot be read
+    """
+    rss = current_rss_mb()
+    if rss is None:
+        return None
+    # A child that exited since it was listed simply counts as 0
+    return rss + sum(_statm_rss_mb(pid) or 0.0 for pid in child_pids())
+
+
+class MemoryGovernor:
+    """
+    Hold back new work while the process and its workers are above a memory ceiling.
+    
+    Callers invoke wait_for_headroom() before starting a PDF or submitting
+    a page range, passing the futures still in flight. Memory is the RSS
+    of this process plus its child processes (the page workers). Above
+    the ceiling the governor collects garbage once; if that is not
+    enough it waits for in-flight work to finish, since nothing else can
+    free memory. With nothing in flight it warns and lets the work run
+    rather than sleeping.
+    """
+    
+    def __init__(self, limit_mb: Optional[float] = None, max_wait: float = 60.0):
+        self.limit_mb = limit_mb
+        self.max_wait = max_wait
+        self.throttled = 0
+    
+    def wait_for_headroom(self, in_flight: Iterable[Future] = ()) -> bool:
+        """
+        Block until memory is below the ceiling, or until nothing in flight could free any.
+        
+        Args:
+            in_flight: Futures of work already submitted (e.g. page ranges)
+            
+        Returns:
+            True if there is headroom, False if the work goes ahead above the ceiling
+        """
+        if not self.limit_mb:
+            return True
+        
+        rss = total_rss_mb()
+        if rss is None or rss < self.limit_mb:
+            return True
+        
+        self.throttled += 1
+        gc.collect()
+        rss = total_rss_mb()
+        
+        pending = {future for future in in_flight if not future.done()}
+        deadline = time.monotonic() + self.max_wait
+        while rss is not None and rss >= self.limit_mb and pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            rss = total_rss_mb()
+        
+        if rss is not None and rss >= self.limit_mb:
+            print(f"    ⚠ Memory at {rss:.0f} MB (limit {self.limit_mb:.0f} MB) with nothing left to wait for; continuing")
+            return False
+        return True
+
+
+class MemoryReport:
+    """Track peak traced Python memory per PDF with tracemalloc."""
+    
+    def __init__(self):
+        self.peaks = {}
+    
+    def start(self):
+        """Start tracing allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    
+    def stop(self):
+        """Stop tracing allocations."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    @contextmanager
+    def track(self, name: str):
+        """
+        Record the memory the block allocates under `name`.
+        
+        Both figures are relative to the traced memory on entry, so what
+        earlier PDFs left behind is not counted again.
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.peaks[name] = {
+                'peak_mb': (peak - start) / (1024 * 1024),
+                'retained_mb': (current - start) / (1024 * 1024)
+            }
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Peak and retained MB per tracked PDF."""
+        return dict(self.peaks)
+    
+    def print_summary(self):
+        """Print the per-PDF memory table."""
+        if not self.peaks:
+            return
+        print("\n🧠 Memory Report (tracemalloc)")
+        for name, stats in self.peaks.items():
+            print(f"  • {name}: peak {stats['peak_mb']:.1f} MB, retained {stats['retained_mb']:.1f} MB")
+        worst = max(self.peaks.values(), key=lambda stats: stats['peak_mb'])
+        print(f"  • Highest peak: {worst['peak_mb']:.1f} MB")
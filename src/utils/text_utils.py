@@ -43,6 +43,22 @@ def extract_month_from_text(text: str) -> str:
     
     return None
 
+def extract_year_from_text(text: str) -> Optional[str]:
+    """
+    Extract the four-digit Gregorian year from PDF text.
+    
+    Args:
+        text: PDF text content
+        
+    Returns:
+        Year (e.g. '2025') or None
+    """
+    match = re.search(r'\b(20\d{2})\b', text)
+    if match:
+        return match.group(1)
+    return None
+
+
 def normalize_month(month_input: str) -> Optional[str]:
     """Normalize user input like 'jan', 'JAN', '3' → 'March'."""
     if not month_input: